@@ -1,12 +1,47 @@
 """
-In-memory cache for API responses (FRED, and later Google Trends).
-Key: (source, series_id, start_date, end_date). Value: list of {date, value}.
+In-memory cache for API responses (FRED, Google Trends, NBER).
+Key: (source, series_id, start_date, end_date). Value: list of Observation (or, for metadata
+sources like "fred_series", the fetched object).
+Bounded LRU: at most CAUSAL_GUESSR_CACHE_MAX entries (default 1024); least recently used is evicted.
+Entries also expire after a per-source TTL (checked lazily on access; NBER data never expires).
 """
 
-from typing import Callable
+import os
+import sys
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, TypeVar
 
-# Module-level store; key = _make_key(...), value = list of observations
-_cache: dict[tuple[str, str, str, str], list[dict]] = {}
+T = TypeVar("T")
+
+MAXSIZE = int(os.environ.get("CAUSAL_GUESSR_CACHE_MAX", "1024"))
+
+# Seconds an entry stays fresh, per source. None = never expires (historical data).
+DEFAULT_TTL_SECONDS: dict[str, float | None] = {
+    "fred": float(os.environ.get("CAUSAL_GUESSR_CACHE_TTL_FRED", "21600")),
+    "google_trends": float(os.environ.get("CAUSAL_GUESSR_CACHE_TTL_GOOGLE_TRENDS", "3600")),
+    "nber": None,
+    # NBER series descriptions (get_series_info); the files never change
+    "nber_info": None,
+    # FRED metadata lookups (get_series / search_series)
+    "fred_series": float(os.environ.get("CAUSAL_GUESSR_CACHE_TTL_FRED_SERIES", "86400")),
+    "fred_search": float(os.environ.get("CAUSAL_GUESSR_CACHE_TTL_FRED_SEARCH", "3600")),
+}
+
+# Interned source names: key components compare by identity on the dict-lookup fast path
+_SOURCES: dict[str, str] = {
+    s: sys.intern(s) for s in ("fred", "google_trends", "nber", "nber_info", "fred_series", "fred_search")
+}
+
+# Module-level store; key = _make_key(...), value = (observations, expiry monotonic ts or None).
+# Order = LRU -> MRU.
+_cache: "OrderedDict[tuple[str, str, str, str], tuple[Any, float | None]]" = OrderedDict()
+_cache_lock = threading.Lock()
+
+# Keys currently being fetched; waiters block on the Event instead of calling the fetcher too
+_inflight: dict[tuple[str, str, str, str], threading.Event] = {}
+_inflight_lock = threading.Lock()
 
 
 def _make_key(
@@ -15,18 +50,51 @@ def _make_key(
     start_date: str,
     end_date: str,
 ) -> tuple[str, str, str, str]:
-    """Build cache key from source and series params."""
-    return (source, series_id, start_date, end_date)
+    """Build cache key from source and series params (source and series_id interned)."""
+    return (
+        _SOURCES.get(source) or sys.intern(source),
+        sys.intern(series_id),
+        start_date,
+        end_date,
+    )
+
 
+def _get(key: tuple[str, str, str, str]) -> Any | None:
+    """Return cached value if present and fresh (marking it most recently used), else None."""
+    with _cache_lock:
+        entry = _cache.get(key)
+        if entry is None:
+            return None
+        value, expiry = entry
+        if expiry is not None and time.monotonic() > expiry:
+            del _cache[key]
+            return None
+        _cache.move_to_end(key)
+        return value
 
-def _get(key: tuple[str, str, str, str]) -> list[dict] | None:
-    """Return cached value if present, else None."""
-    return _cache.get(key)
 
+def _sweep_expired(now: float) -> None:
+    """Drop expired entries from the least recently used 10% (caller holds _cache_lock)."""
+    n = max(1, len(_cache) // 10)
+    expired = []
+    for i, (key, (_, expiry)) in enumerate(_cache.items()):
+        if i >= n:
+            break
+        if expiry is not None and now > expiry:
+            expired.append(key)
+    for key in expired:
+        del _cache[key]
 
-def _set(key: tuple[str, str, str, str], value: list[dict]) -> None:
-    """Store value in cache."""
-    _cache[key] = value
+
+def _set(key: tuple[str, str, str, str], value: Any, ttl: float | None = None) -> None:
+    """Store value in cache with optional TTL, evicting expired and least recently used entries."""
+    now = time.monotonic()
+    with _cache_lock:
+        _cache[key] = (value, now + ttl if ttl is not None else None)
+        _cache.move_to_end(key)
+        _sweep_expired(now)
+        while len(_cache) > MAXSIZE:
+            _cache.popitem(last=False)
 
 
 def get_or_fetch(
@@ -34,10 +102,13 @@ def get_or_fetch(
     series_id: str,
     start_date: str,
     end_date: str,
-    fetcher: Callable[[], list[dict]],
-) -> list[dict]:
+    fetcher: Callable[[], T],
+    *,
+    ttl: float | None = None,
+) -> T:
     """
     Return observations from cache if present; otherwise call fetcher(), store, and return.
+    Concurrent misses on the same key call fetcher() once; the other callers wait for it.
 
     Args:
         source: e.g. "fred".
@@ -45,19 +116,42 @@ def get_or_fetch(
         start_date: YYYY-MM-DD.
         end_date: YYYY-MM-DD.
         fetcher: No-arg callable that returns the observations list (e.g. calls the API).
+        ttl: Seconds the entry stays fresh. Defaults to DEFAULT_TTL_SECONDS for the source.
 
     Returns:
-        List of {"date": "YYYY-MM-DD", "value": "..."}.
+        Whatever fetcher returns (for observation sources, a list of Observation).
     """
     key = _make_key(source, series_id, start_date, end_date)
-    cached = _get(key)
-    if cached is not None:
-        return cached
-    value = fetcher()
-    _set(key, value)
-    return value
+    while True:
+        cached = _get(key)
+        if cached is not None:
+            return cached
+        with _inflight_lock:
+            cached = _get(key)
+            if cached is not None:
+                return cached
+            event = _inflight.get(key)
+            leader = event is None
+            if leader:
+                event = _inflight[key] = threading.Event()
+        if leader:
+            break
+        # Another thread is fetching this key; wait, then re-check (retry ourselves if it failed)
+        event.wait()
+
+    if ttl is None:
+        ttl = DEFAULT_TTL_SECONDS.get(source)
+    try:
+        value = fetcher()
+        _set(key, value, ttl)
+        return value
+    finally:
+        with _inflight_lock:
+            _inflight.pop(key, None)
+        event.set()
 
 
 def clear() -> None:
     """Clear the cache (e.g. for tests)."""
-    _cache.clear()
+    with _cache_lock:
+        _cache.clear()
@@ -0,0 +1,100 @@
+"""
+Persistent on-disk cache (SQLite) for results that are expensive to refetch and safe to keep
+across restarts, e.g. NBER series (immutable historical data).
+Key: string. Value: any picklable object. Entries may carry an expiry (wall-clock seconds).
+Location: CAUSAL_GUESSR_DISK_CACHE (default <project>/.cache/causal_guessr.sqlite3);
+set it to an empty string to disable the disk tier.
+"""
+
+import logging
+import os
+import pickle
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+DEFAULT_PATH = PROJECT_ROOT / ".cache" / "causal_guessr.sqlite3"
+
+_path = os.environ.get("CAUSAL_GUESSR_DISK_CACHE", str(DEFAULT_PATH))
+
+# One connection shared by all threads; sqlite3 calls are serialized by the lock
+_conn: sqlite3.Connection | None = None
+_conn_lock = threading.Lock()
+_disabled = not _path
+
+
+def _connect() -> sqlite3.Connection | None:
+    """Open (once) the cache database. Returns None if the disk tier is disabled or unusable."""
+    global _conn, _disabled
+    if _conn is not None or _disabled:
+        return _conn
+    try:
+        Path(_path).parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(_path, check_same_thread=False, isolation_level=None)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("CREATE TABLE IF NOT EXISTS kv (key TEXT PRIMARY KEY, value BLOB NOT NULL, expires REAL)")
+    except (OSError, sqlite3.Error) as e:
+        logger.warning("Disk cache disabled (%s): %s", _path, e)
+        _disabled = True
+        return None
+    _conn = conn
+    return _conn
+
+
+def get(key: str) -> Any | None:
+    """Return the cached value for key, or None if missing, expired, or the disk tier is off."""
+    with _conn_lock:
+        conn = _connect()
+        if conn is None:
+            return None
+        try:
+            row = conn.execute("SELECT value, expires FROM kv WHERE key = ?", (key,)).fetchone()
+        except sqlite3.Error as e:
+            logger.warning("Disk cache read failed for %s: %s", key, e)
+            return None
+    if row is None:
+        return None
+    blob, expires = row
+    if expires is not None and expires <= time.time():
+        return None
+    try:
+        return pickle.loads(blob)
+    except Exception as e:
+        logger.warning("Disk cache entry unreadable for %s: %s", key, e)
+        return None
+
+
+def set(key: str, value: Any, ttl: float | None = None) -> None:
+    """Store value under key. ttl=None keeps it until clear(). Failures are logged, not raised."""
+    blob = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+    expires = time.time() + ttl if ttl is not None else None
+    with _conn_lock:
+        conn = _connect()
+        if conn is None:
+            return
+        try:
+            conn.execute("INSERT OR REPLACE INTO kv (key, value, expires) VALUES (?, ?, ?)", (key, blob, expires))
+        except sqlite3.Error as e:
+            logger.warning("Disk cache write failed for %s: %s", key, e)
+
+
+def clear() -> None:
+    """Remove all entries (mainly for tests)."""
+    with _conn_lock:
+        conn = _connect()
+        if conn is not None:
+            conn.execute("DELETE FROM kv")
+
+
+def close() -> None:
+    """Close the shared connection (reopened lazily on next use)."""
+    global _conn
+    with _conn_lock:
+        if _conn is not None:
+            _conn.close()
+            _conn = None
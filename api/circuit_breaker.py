@@ -0,0 +1,95 @@
+"""
+Per-upstream circuit breakers (FRED, Google Trends). After BREAKER_FAIL_MAX consecutive outage
+failures (connection errors, timeouts, 429, 5xx) the breaker opens and calls fail fast with
+CircuitOpenError for BREAKER_RESET_SECONDS. It is then half-open: a single trial call goes through
+(others keep failing fast) and its outcome closes or re-opens the breaker. Client errors (bad
+series id, 400/404) are not counted: the upstream answered, which counts as a success.
+Backoff between retries stays with the HTTP clients (urllib3 Retry; Trends does not retry).
+"""
+
+import logging
+import os
+import threading
+import time
+
+import requests
+
+logger = logging.getLogger(__name__)
+
+BREAKER_FAIL_MAX = int(os.environ.get("CAUSAL_GUESSR_BREAKER_FAIL_MAX", "3"))
+BREAKER_RESET_SECONDS = float(os.environ.get("CAUSAL_GUESSR_BREAKER_RESET_SECONDS", "60"))
+
+
+class CircuitOpenError(RuntimeError):
+    """Raised instead of calling an upstream whose breaker is open."""
+
+
+def _is_outage(exc: BaseException) -> bool:
+    """True for failures that indicate the upstream is down or throttling, not a bad request."""
+    if isinstance(exc, (requests.ConnectionError, requests.Timeout, requests.exceptions.RetryError)):
+        return True
+    # requests.HTTPError and pytrends' ResponseError both carry the response
+    status = getattr(getattr(exc, "response", None), "status_code", None)
+    return status is not None and (status == 429 or status >= 500)
+
+
+class CircuitBreaker:
+    """Consecutive-failure breaker for one upstream; safe to share between threads."""
+
+    def __init__(self, name: str, fail_max: int = BREAKER_FAIL_MAX, reset_timeout: float = BREAKER_RESET_SECONDS):
+        self.name = name
+        self.fail_max = fail_max
+        self.reset_timeout = reset_timeout
+        self._failures = 0
+        self._opened_at: float | None = None
+        # When the half-open trial call started (None: no trial in flight). A trial that never
+        # reports back stops blocking others after reset_timeout.
+        self._trial_started: float | None = None
+        self._lock = threading.Lock()
+
+    def before_call(self) -> None:
+        """
+        Raise CircuitOpenError while the breaker is open (cool-down not over, or another caller's
+        half-open trial still in flight); otherwise return and let the call proceed.
+        """
+        if self._opened_at is None:
+            return
+        with self._lock:
+            opened_at = self._opened_at
+            if opened_at is None:
+                return
+            now = time.monotonic()
+            trial = self._trial_started
+            if now - opened_at < self.reset_timeout or (trial is not None and now - trial < self.reset_timeout):
+                raise CircuitOpenError(f"{self.name} unavailable (circuit open after repeated failures)")
+            self._trial_started = now
+
+    def record(self, exc: BaseException | None) -> None:
+        """Record a call's outcome: None for success, else the exception it raised."""
+        outage = exc is not None and _is_outage(exc)
+        with self._lock:
+            self._trial_started = None
+            if not outage:
+                self._failures = 0
+                self._opened_at = None
+                return
+            self._failures += 1
+            if self._failures >= self.fail_max:
+                if self._opened_at is None:
+                    logger.warning("%s circuit open for %ss: %s", self.name, self.reset_timeout, exc)
+                self._opened_at = time.monotonic()
+
+    def call(self, fn, *args, **kwargs):
+        """fn(*args, **kwargs) through the breaker: fail fast if open, record the outcome."""
+        self.before_call()
+        try:
+            result = fn(*args, **kwargs)
+        except Exception as e:
+            self.record(e)
+            raise
+        self.record(None)
+        return result
+
+
+fred_breaker = CircuitBreaker("FRED")
+google_trends_breaker = CircuitBreaker("Google Trends")
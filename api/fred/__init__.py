@@ -1,6 +1,7 @@
 """FRED (Federal Reserve Economic Data) API client."""
 
 from api.fred.client import (
+    close,
     get_observations,
     get_observations_cached,
     get_release_series,
@@ -10,6 +11,7 @@ from api.fred.client import (
 )
 
 __all__ = [
+    "close",
     "get_observations",
     "get_observations_cached",
     "get_release_series",
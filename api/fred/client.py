@@ -3,15 +3,32 @@ FRED (Federal Reserve Economic Data) API client.
 Fetches series observations for a given series_id and date range.
 Loads FRED_API_KEY / FRED_API_KEYS from .env in the project root.
 Uses round-robin over FRED_API_KEYS when set for parallelized requests.
+Prefetches the releases list in a background thread at import (FRED_PREWARM=0 to disable).
 """
 
+import itertools
+import json
 import logging
+import multiprocessing
 import os
 import threading
 from pathlib import Path
 
 import requests
 from dotenv import load_dotenv
+from requests.adapters import HTTPAdapter
+from urllib3.util.request import ACCEPT_ENCODING
+from urllib3.util.retry import Retry
+
+from api.circuit_breaker import fred_breaker
+from api.observations import Observation
+
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+except ImportError:  # stdlib fallback; same result, slower decode
+    _json_loads = json.loads
 
 # Load .env from project root (api/fred/client.py -> parent.parent.parent = project root)
 load_dotenv(Path(__file__).resolve().parent.parent.parent / ".env")
@@ -29,36 +46,84 @@ _keys_list: list[str] | None = None
 _releases_cache: list[dict] | None = None
 _releases_cache_lock = threading.Lock()
 _keys_lock = threading.Lock()
-_key_index = 0
+_key_cycle: "itertools.cycle[str] | None" = None
+
+
+def _make_session() -> requests.Session:
+    """Build the shared Session: keep-alive pool, compressed JSON responses, retry on transient 429/5xx."""
+    session = requests.Session()
+    # urllib3 lists br only when a brotli decoder is importable, so this never asks for an undecodable body
+    session.headers.update({"Accept": "application/json", "Accept-Encoding": ACCEPT_ENCODING})
+    adapter = HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=32,
+        max_retries=Retry(
+            total=4,
+            backoff_factor=0.5,
+            status_forcelist=[429, 500, 502, 503, 504],
+            allowed_methods=["GET"],
+            respect_retry_after_header=True,
+            raise_on_status=False,
+        ),
+    )
+    session.mount("https://", adapter)
+    return session
+
+
+# Shared across threads so HTTPS connections to api.stlouisfed.org are reused (no TLS handshake per call)
+_session = _make_session()
 
 
 def _get_keys() -> list[str]:
     """Return list of API keys (FRED_API_KEYS comma-separated, or [FRED_API_KEY])."""
     global _keys_list
+    # Fast path: the list is published once, fully built, so reading it needs no lock
+    keys = _keys_list
+    if keys is not None:
+        return keys
     with _keys_lock:
         if _keys_list is not None:
             return _keys_list
         raw = os.environ.get("FRED_API_KEYS")
         if raw:
-            _keys_list = [k.strip() for k in raw.split(",") if k.strip()]
+            keys = [k.strip() for k in raw.split(",") if k.strip()]
         else:
             single = os.environ.get("FRED_API_KEY")
-            _keys_list = [single] if single else []
-        return _keys_list
+            keys = [single] if single else []
+        _keys_list = keys
+        return keys
 
 
 def _next_key() -> str:
-    """Return next API key in round-robin (thread-safe)."""
-    global _key_index
-    keys = _get_keys()
-    if not keys:
-        raise ValueError(
-            "FRED API key required. Set FRED_API_KEY or FRED_API_KEYS in the environment."
-        )
-    with _keys_lock:
-        key = keys[_key_index % len(keys)]
-        _key_index += 1
-        return key
+    """Return next API key in round-robin (thread-safe: next() on a shared cycle is atomic under the GIL)."""
+    global _key_cycle
+    key_cycle = _key_cycle
+    if key_cycle is None:
+        keys = _get_keys()
+        if not keys:
+            raise ValueError(
+                "FRED API key required. Set FRED_API_KEY or FRED_API_KEYS in the environment."
+            )
+        with _keys_lock:
+            if _key_cycle is None:
+                _key_cycle = itertools.cycle(keys)
+            key_cycle = _key_cycle
+    return next(key_cycle)
+
+
+# (connect, read) seconds per try. A stalled read is retried by the Session's Retry like a 5xx, so one
+# slow FRED response costs seconds rather than holding a puzzle attempt for half a minute.
+_TIMEOUT = (2, 5)
+
+
+def _try_key(url: str, params: dict, key: str) -> requests.Response:
+    """GET url with key as api_key param; on 403 retry once with the key as a Bearer token."""
+    p = {"file_type": "json", **params, "api_key": key}
+    resp = _session.get(url, params=p, timeout=_TIMEOUT)
+    if resp.status_code == 403:
+        p.pop("api_key", None)
+        resp = _session.get(url, params=p, headers={"Authorization": f"Bearer {key}"}, timeout=_TIMEOUT)
+    return resp
 
 
 def _request(
@@ -68,31 +133,44 @@ def _request(
     api_key: str | None = None,
     log_label: str = "FRED",
 ) -> dict:
-    """GET url with params; try api_key then Bearer on 403. Returns JSON body. Raises on non-200."""
+    """
+    GET url with params, rotating through API keys on 403 (each key tried as api_key, then Bearer).
+    Transient 429/5xx are retried with backoff by the Session adapter. Returns JSON body.
+    Raises on non-200, and CircuitOpenError without a request while FRED is failing repeatedly.
+    """
+    return fred_breaker.call(_request_keys, url, params, api_key=api_key, log_label=log_label)
+
+
+def _request_keys(url: str, params: dict, *, api_key: str | None, log_label: str) -> dict:
+    """_request without the circuit breaker."""
     keys = _get_keys()
     if not keys and not api_key:
         raise ValueError(
             "FRED API key required. Set FRED_API_KEY or FRED_API_KEYS in the environment."
         )
     if api_key:
-        keys_to_try = [api_key]
+        keys_to_try = (api_key,)
+        n_keys = 1
     else:
         first = _next_key()
-        keys_to_try = [first] + [k for k in keys if k != first]
+        # Lazy: in the common case the first key succeeds and the rest are never materialized
+        keys_to_try = itertools.chain((first,), (k for k in keys if k != first))
+        n_keys = len(keys)
     last_error = None
     for key_idx, key in enumerate(keys_to_try):
-        p = {**params, "api_key": key, "file_type": "json"}
-        resp = requests.get(url, params=p, timeout=30)
-        if resp.status_code == 403:
-            p.pop("api_key", None)
-            resp = requests.get(url, params=p, headers={"Authorization": f"Bearer {key}"}, timeout=30)
+        resp = _try_key(url, params, key)
         if resp.status_code == 200:
-            return resp.json()
+            return _json_loads(resp.content)
         if resp.status_code == 403:
-            logger.warning("%s 403 key_index=%s/%s", log_label, key_idx + 1, len(keys_to_try))
+            logger.warning("%s 403 key_index=%s/%s", log_label, key_idx + 1, n_keys)
         last_error = resp
     if last_error is not None:
         logger.error("%s failed status=%s", log_label, last_error.status_code)
+        if last_error.status_code == 403:
+            logger.error(
+                "FRED 403 for all keys usually means the API key(s) do not have API access. "
+                "Check https://fred.stlouisfed.org/docs/api/api_key.html and your FRED account."
+            )
         last_error.raise_for_status()
     raise ValueError("FRED API key required. Set FRED_API_KEY or FRED_API_KEYS.")
 
@@ -104,7 +182,7 @@ def get_observations(
     *,
     api_key: str | None = None,
     file_type: str = "json",
-) -> list[dict]:
+) -> list[Observation]:
     """
     Fetch observations (time-series data) from FRED for one series.
 
@@ -116,77 +194,29 @@ def get_observations(
         file_type: Response format; "json" is default.
 
     Returns:
-        List of {"date": "YYYY-MM-DD", "value": "..."}. Value may be "." for missing.
+        List of Observation(date="YYYY-MM-DD", value="..."). Value may be "." for missing.
     """
-    keys = _get_keys()
-    if not keys and not api_key:
-        raise ValueError(
-            "FRED API key required. Set FRED_API_KEY or FRED_API_KEYS in the environment."
-        )
-    if api_key:
-        keys_to_try = [api_key]
-    else:
-        first = _next_key()
-        keys_to_try = [first] + [k for k in keys if k != first]
-    last_error = None
-    for key_idx, key in enumerate(keys_to_try):
-        params = {
+    data = _request(
+        FRED_OBSERVATIONS_URL,
+        {
             "series_id": series_id,
             "observation_start": observation_start,
             "observation_end": observation_end,
-            "api_key": key,
             "file_type": file_type,
-        }
-        resp = requests.get(FRED_OBSERVATIONS_URL, params=params, timeout=30)
-        if resp.status_code == 403:
-            logger.warning(
-                "FRED observations 403 series_id=%s observation_start=%s observation_end=%s key_index=%s/%s (trying Bearer next)",
-                series_id,
-                observation_start,
-                observation_end,
-                key_idx + 1,
-                len(keys_to_try),
-            )
-            params.pop("api_key", None)
-            resp = requests.get(
-                FRED_OBSERVATIONS_URL,
-                params=params,
-                headers={"Authorization": f"Bearer {key}"},
-                timeout=30,
-            )
-        if resp.status_code == 200:
-            data = resp.json()
-            observations = data.get("observations", [])
-            logger.info(
-                "FRED observations 200 series_id=%s observation_start=%s observation_end=%s n_obs=%s",
-                series_id,
-                observation_start,
-                observation_end,
-                len(observations),
-            )
-            return [{"date": ob["date"], "value": ob["value"]} for ob in observations]
-        if resp.status_code == 403:
-            logger.warning(
-                "FRED observations 403 (after Bearer) series_id=%s key_index=%s/%s",
-                series_id,
-                key_idx + 1,
-                len(keys_to_try),
-            )
-        last_error = resp
-    if last_error is not None:
-        logger.error(
-            "FRED observations failed for all keys series_id=%s observation_start=%s observation_end=%s status=%s",
-            series_id,
-            observation_start,
-            observation_end,
-            last_error.status_code,
-        )
-        logger.error(
-            "FRED 403 for all keys usually means the API key(s) do not have API access. "
-            "Check https://fred.stlouisfed.org/docs/api/api_key.html and your FRED account."
-        )
-        last_error.raise_for_status()
-    raise ValueError("FRED API key required. Set FRED_API_KEY or FRED_API_KEYS.")
+        },
+        api_key=api_key,
+        log_label=f"FRED observations series_id={series_id}",
+    )
+    observations = data.get("observations", [])
+    logger.info(
+        "FRED observations 200 series_id=%s observation_start=%s observation_end=%s n_obs=%s",
+        series_id,
+        observation_start,
+        observation_end,
+        len(observations),
+    )
+    # Upstream rows also carry realtime_start/realtime_end; keep only date and value
+    return [Observation(ob["date"], ob["value"]) for ob in observations]
 
 
 def get_observations_cached(
@@ -195,14 +225,14 @@ def get_observations_cached(
     observation_end: str,
     *,
     api_key: str | None = None,
-) -> list[dict]:
+) -> list[Observation]:
     """
     Same as get_observations, but uses the in-memory cache. Repeated calls for the
     same series and date range return cached data without calling the API.
     """
     from api.cache import get_or_fetch
 
-    def _fetch() -> list[dict]:
+    def _fetch() -> list[Observation]:
         return get_observations(
             series_id,
             observation_start,
@@ -222,55 +252,26 @@ def get_observations_cached(
 def get_series(series_id: str, *, api_key: str | None = None) -> dict:
     """
     Fetch series metadata from FRED (title, observation_start, observation_end, etc.).
+    Cached per series_id (TTL: api.cache DEFAULT_TTL_SECONDS["fred_series"], 24h by default).
 
     Returns:
         The first (and usually only) series object from the API, e.g. {"id", "title", ...}.
     """
-    keys = _get_keys()
-    if not keys and not api_key:
-        raise ValueError(
-            "FRED API key required. Set FRED_API_KEY or FRED_API_KEYS in the environment."
-        )
-    if api_key:
-        keys_to_try = [api_key]
-    else:
-        first = _next_key()
-        keys_to_try = [first] + [k for k in keys if k != first]
-    last_error = None
-    for key_idx, key in enumerate(keys_to_try):
-        params = {"series_id": series_id, "api_key": key, "file_type": "json"}
-        resp = requests.get(FRED_SERIES_URL, params=params, timeout=30)
-        if resp.status_code == 403:
-            logger.warning(
-                "FRED series 403 series_id=%s key_index=%s/%s (trying Bearer next)",
-                series_id,
-                key_idx + 1,
-                len(keys_to_try),
-            )
-            params.pop("api_key", None)
-            resp = requests.get(
-                FRED_SERIES_URL,
-                params=params,
-                headers={"Authorization": f"Bearer {key}"},
-                timeout=30,
-            )
-        if resp.status_code == 200:
-            data = resp.json()
-            seriess = data.get("seriess", [])
-            if not seriess:
-                raise ValueError(f"No series found for id={series_id!r}")
-            return seriess[0]
-        if resp.status_code == 403:
-            logger.warning("FRED series 403 (after Bearer) series_id=%s", series_id)
-        last_error = resp
-    if last_error is not None:
-        logger.error("FRED series failed for all keys series_id=%s status=%s", series_id, last_error.status_code)
-        logger.error(
-            "FRED 403 for all keys usually means the API key(s) do not have API access. "
-            "Check https://fred.stlouisfed.org/docs/api/api_key.html and your FRED account."
+    from api.cache import get_or_fetch
+
+    def _fetch() -> dict:
+        data = _request(
+            FRED_SERIES_URL,
+            {"series_id": series_id},
+            api_key=api_key,
+            log_label=f"FRED series series_id={series_id}",
         )
-        last_error.raise_for_status()
-    raise ValueError("FRED API key required. Set FRED_API_KEY or FRED_API_KEYS.")
+        seriess = data.get("seriess", [])
+        if not seriess:
+            raise ValueError(f"No series found for id={series_id!r}")
+        return seriess[0]
+
+    return get_or_fetch("fred_series", series_id, "", "", _fetch)
 
 
 def search_series(
@@ -281,14 +282,20 @@ def search_series(
 ) -> list[dict]:
     """
     Search FRED series by text. Returns list of series dicts (id, title, observation_start, observation_end, etc.).
+    Cached per (search_text, limit) (TTL: 1h by default).
     """
-    data = _request(
-        FRED_SERIES_SEARCH_URL,
-        {"search_text": search_text, "limit": limit},
-        api_key=api_key,
-        log_label="FRED search",
-    )
-    return data.get("seriess", [])
+    from api.cache import get_or_fetch
+
+    def _fetch() -> list[dict]:
+        data = _request(
+            FRED_SERIES_SEARCH_URL,
+            {"search_text": search_text, "limit": limit},
+            api_key=api_key,
+            log_label="FRED search",
+        )
+        return data.get("seriess", [])
+
+    return get_or_fetch("fred_search", search_text, str(limit), "", _fetch)
 
 
 def get_releases(*, api_key: str | None = None) -> list[dict]:
@@ -305,6 +312,9 @@ def get_releases(*, api_key: str | None = None) -> list[dict]:
 def get_releases_cached(*, api_key: str | None = None) -> list[dict]:
     """Return cached list of FRED releases; fetch once and cache at first call (e.g. app startup)."""
     global _releases_cache
+    releases = _releases_cache
+    if releases is not None:
+        return releases
     with _releases_cache_lock:
         if _releases_cache is not None:
             return _releases_cache
@@ -331,3 +341,23 @@ def get_release_series(
         log_label="FRED release/series",
     )
     return data.get("seriess", [])
+
+
+def close() -> None:
+    """Release pooled connections (e.g. at app shutdown); they reopen on use."""
+    _session.close()
+
+
+def _prewarm() -> None:
+    """Fill the releases cache (and open the pooled connection) off the request path."""
+    try:
+        get_releases_cached()
+    except Exception:
+        pass
+
+
+# Start fetching releases at import so the first seed request doesn't pay the round-trip.
+# Concurrent first callers simply wait on _releases_cache_lock. Disable with FRED_PREWARM=0.
+# Skipped in child processes (e.g. multiprocessing workers), which never build seed prompts.
+if os.environ.get("FRED_PREWARM", "1") == "1" and multiprocessing.parent_process() is None and _get_keys():
+    threading.Thread(target=_prewarm, name="fred-prewarm", daemon=True).start()
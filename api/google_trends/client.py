@@ -1,20 +1,27 @@
 """
 Google Trends client via pytrends (unofficial, no API key).
 Fetches search interest over time for a keyword and date range.
-Returns list of {"date": "YYYY-MM-DD", "value": "0-100"} for compatibility with plotter.
+Returns list of Observation(date="YYYY-MM-DD", value="0-100"), like the other API clients.
 """
 
 import logging
 
+from api.circuit_breaker import google_trends_breaker
+from api.observations import Observation
+
 logger = logging.getLogger(__name__)
 
+# 2s connect / 5s read. No retries/backoff_factor: pytrends 4.9 builds its urllib3 Retry with
+# method_whitelist, which urllib3 2.x rejects (TypeError on every request).
+_TRENDREQ_KWARGS = {"hl": "en-US", "tz": 360, "timeout": (2, 5)}
+
 
 def get_interest_over_time(
     keyword: str,
     start_date: str,
     end_date: str,
     geo: str = "",
-) -> list[dict]:
+) -> list[Observation]:
     """
     Fetch Google Trends interest-over-time for one keyword.
 
@@ -25,7 +32,7 @@ def get_interest_over_time(
         geo: Optional country code (e.g. "" for worldwide, "US" for United States).
 
     Returns:
-        List of {"date": "YYYY-MM-DD", "value": str 0-100}. Empty if no data or error.
+        List of Observation(date="YYYY-MM-DD", value=str 0-100). Empty if no data or error.
     """
     try:
         from pytrends.request import TrendReq
@@ -33,13 +40,17 @@ def get_interest_over_time(
         raise ValueError("pytrends required. Install with: pip install pytrends")
 
     timeframe = f"{start_date} {end_date}"
+    # Fail fast (CircuitOpenError) while Trends is throttling or down rather than waiting out retries
+    google_trends_breaker.before_call()
     try:
-        trend = TrendReq(hl="en-US", tz=360)
+        trend = TrendReq(**_TRENDREQ_KWARGS)
         trend.build_payload(kw_list=[keyword], timeframe=timeframe, geo=geo if geo else None)
         df = trend.interest_over_time()
     except Exception as e:
+        google_trends_breaker.record(e)
         logger.warning("pytrends request failed for keyword=%s: %s", keyword, e)
         raise
+    google_trends_breaker.record(None)
 
     if df is None or df.empty:
         return []
@@ -53,17 +64,16 @@ def get_interest_over_time(
     if value_col is None:
         return []
 
-    out = []
-    for ts, row in df.iterrows():
-        if hasattr(ts, "strftime"):
-            date_str = ts.strftime("%Y-%m-%d")
-        else:
-            date_str = str(ts)[:10]
-        val = row.get(value_col)
-        if val is None or (isinstance(val, float) and (val != val)):  # NaN
-            continue
-        out.append({"date": date_str, "value": str(int(val))})
-    return out
+    # Vectorized column extraction (no per-row iterrows); NaN rows are dropped
+    col = df[value_col]
+    col = col[col.notna()]
+    index = col.index
+    if hasattr(index, "strftime"):
+        dates = index.strftime("%Y-%m-%d").tolist()
+    else:
+        dates = [str(ts)[:10] for ts in index]
+    values = col.astype(int).astype(str).tolist()
+    return [Observation(d, v) for d, v in zip(dates, values)]
 
 
 def get_interest_over_time_cached(
@@ -71,11 +81,23 @@ def get_interest_over_time_cached(
     start_date: str,
     end_date: str,
     geo: str = "",
-) -> list[dict]:
+) -> list[Observation]:
     """Same as get_interest_over_time but uses in-memory cache."""
     from api.cache import get_or_fetch
 
-    def _fetch() -> list[dict]:
+    def _fetch() -> list[Observation]:
         return get_interest_over_time(keyword, start_date, end_date, geo)
 
     return get_or_fetch("google_trends", keyword, start_date, end_date, _fetch)
+
+
+if __name__ == "__main__":
+    # Self-test (offline): our TrendReq kwargs must not hit pytrends' Retry(method_whitelist=...) path
+    import inspect
+
+    from urllib3.util.retry import Retry
+
+    if "method_whitelist" not in inspect.signature(Retry).parameters:
+        assert not _TRENDREQ_KWARGS.get("retries"), "pytrends retries break under urllib3 2"
+        assert not _TRENDREQ_KWARGS.get("backoff_factor"), "pytrends backoff_factor breaks under urllib3 2"
+    print("TrendReq kwargs ok:", _TRENDREQ_KWARGS)
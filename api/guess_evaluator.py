@@ -6,62 +6,147 @@ exactly match the acceptable-answers list. Returns a boolean.
 import logging
 import os
 import re
+import threading
+from collections import OrderedDict
 from pathlib import Path
 
 from dotenv import load_dotenv
 
+from api.openai_client import get_async_client, get_client
+
 load_dotenv(Path(__file__).resolve().parent.parent / ".env")
 
 logger = logging.getLogger(__name__)
 
+# Read once: the environment (incl. .env above) doesn't change within a process
+_OPENAI_API_KEY = (os.environ.get("OPENAI_API_KEY") or "").strip().strip('"').strip("'")
+_OPENAI_MODEL = os.environ.get("OPENAI_MODEL", "gpt-4o-mini")
 
-def evaluate_guess_with_llm(
-    guess: str,
-    correct_event: str,
-    acceptable_answers: list[str],
-) -> bool:
+# LLM verdict counts as correct if it contains the word "true" or "yes"
+_YES_RE = re.compile(r"\b(?:true|yes)\b", re.IGNORECASE)
+
+# Shorter guesses, or ones without a letter or digit, are rejected without an LLM call
+_MIN_GUESS_CHARS = 3
+_WORD_RE = re.compile(r"\w")
+
+# LLM verdicts by (normalized guess, correct_event, acceptable answers), LRU-bounded: a repeated guess
+# for the same answer (same game or a later one) skips the round-trip. Only real verdicts are stored.
+_VERDICT_CACHE_MAX = 4096
+_verdicts: "OrderedDict[tuple, bool]" = OrderedDict()
+_verdicts_lock = threading.Lock()
+
+
+def _verdict_key(guess: str, correct_event: str, acceptable_answers: list[str]) -> tuple:
+    return (guess.strip().lower(), correct_event or "", tuple(acceptable_answers or ()))
+
+
+def _cached_verdict(key: tuple) -> bool | None:
+    with _verdicts_lock:
+        verdict = _verdicts.get(key)
+        if verdict is not None:
+            _verdicts.move_to_end(key)
+        return verdict
+
+
+def _store_verdict(key: tuple, verdict: bool) -> None:
+    with _verdicts_lock:
+        _verdicts[key] = verdict
+        _verdicts.move_to_end(key)
+        while len(_verdicts) > _VERDICT_CACHE_MAX:
+            _verdicts.popitem(last=False)
+
+
+def _guess_prompt(guess: str, correct_event: str, acceptable_answers: list[str]) -> str | None:
     """
-    Ask the LLM whether the guess means the same as the correct answer.
-    Use when the guess is not in the acceptable_answers list.
-    Returns True only if the LLM says the guess is correct; on API failure returns False.
+    Evaluation prompt for guess, or None if the LLM cannot be used (no openai, no key) or the guess
+    is too short or has no letters/digits to mean anything.
     """
     guess = (guess or "").strip()
-    if not guess:
-        return False
+    if len(guess) < _MIN_GUESS_CHARS or not _WORD_RE.search(guess):
+        return None
 
     try:
-        from openai import OpenAI
+        import openai  # noqa: F401
     except ImportError:
         logger.warning("openai not installed, cannot evaluate guess with LLM")
-        return False
+        return None
 
-    api_key = (os.environ.get("OPENAI_API_KEY") or "").strip().strip('"').strip("'")
-    if not api_key:
+    if not _OPENAI_API_KEY:
         logger.warning("OPENAI_API_KEY not set, cannot evaluate guess with LLM")
-        return False
+        return None
 
     correct_event = correct_event or ""
     others = [a for a in (acceptable_answers or []) if a and a.strip().lower() != correct_event.strip().lower()]
     others_str = ", ".join(others[:10]) if others else "none"
 
     from api.prompts import build_guess_evaluation_prompt
-    prompt = build_guess_evaluation_prompt(guess, correct_event, others_str)
+    return build_guess_evaluation_prompt(guess, correct_event, others_str)
+
+
+def _chat_kwargs(prompt: str) -> dict:
+    """Arguments for the one-word verdict completion (shared by sync and async clients)."""
+    return {
+        "model": _OPENAI_MODEL,
+        "messages": [{"role": "user", "content": prompt}],
+        "temperature": 0,
+        "max_tokens": 10,
+    }
+
+
+def _is_yes(text: str) -> bool:
+    """Parse boolean: accept "true", "yes", "1"."""
+    return bool(_YES_RE.search(text)) or text == "1"
+
+
+def evaluate_guess_with_llm(
+    guess: str,
+    correct_event: str,
+    acceptable_answers: list[str],
+) -> bool:
+    """
+    Ask the LLM whether the guess means the same as the correct answer.
+    Use when the guess is not in the acceptable_answers list.
+    Returns True only if the LLM says the guess is correct; on API failure returns False.
+    """
+    key = _verdict_key(guess or "", correct_event, acceptable_answers)
+    verdict = _cached_verdict(key)
+    if verdict is not None:
+        return verdict
+    prompt = _guess_prompt(guess, correct_event, acceptable_answers)
+    if prompt is None:
+        return False
 
     try:
-        client = OpenAI(api_key=api_key)
-        model = os.environ.get("OPENAI_MODEL", "gpt-4o-mini")
-        resp = client.chat.completions.create(
-            model=model,
-            messages=[{"role": "user", "content": prompt}],
-            temperature=0,
-            max_tokens=10,
-        )
+        resp = get_client(_OPENAI_API_KEY).chat.completions.create(**_chat_kwargs(prompt))
         text = (resp.choices[0].message.content or "").strip().lower()
     except Exception as e:
         logger.warning("LLM guess evaluation failed: %s", e)
         return False
+    verdict = _is_yes(text)
+    _store_verdict(key, verdict)
+    return verdict
 
-    # Parse boolean: accept "true", "yes", "1"
-    if re.search(r"\btrue\b", text) or re.search(r"\byes\b", text) or text.strip() == "1":
-        return True
-    return False
+
+async def evaluate_guess_with_llm_async(
+    guess: str,
+    correct_event: str,
+    acceptable_answers: list[str],
+) -> bool:
+    """Async form of evaluate_guess_with_llm (AsyncOpenAI; no worker thread held while waiting)."""
+    key = _verdict_key(guess or "", correct_event, acceptable_answers)
+    verdict = _cached_verdict(key)
+    if verdict is not None:
+        return verdict
+    prompt = _guess_prompt(guess, correct_event, acceptable_answers)
+    if prompt is None:
+        return False
+
+    try:
+        resp = await get_async_client(_OPENAI_API_KEY).chat.completions.create(**_chat_kwargs(prompt))
+        text = (resp.choices[0].message.content or "").strip().lower()
+    except Exception as e:
+        logger.warning("LLM guess evaluation failed: %s", e)
+        return False
+    verdict = _is_yes(text)
+    _store_verdict(key, verdict)
+    return verdict
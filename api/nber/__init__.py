@@ -1,12 +1,14 @@
 """NBER Macrohistory Database API client."""
 
 from api.nber.client import (
+    close,
     get_observations,
     get_observations_cached,
     get_series_info,
 )
 
 __all__ = [
+    "close",
     "get_observations",
     "get_observations_cached",
     "get_series_info",
@@ -1,19 +1,62 @@
 """
 NBER Macrohistory Database client. Fetches .db series from data.nber.org,
-parses annual/quarterly/monthly data, and returns observations as {date, value}.
+parses annual/quarterly/monthly data, and returns observations as Observation(date, value).
 No API key required. Data covers 1800s–1940s (pre-WWI and interwar).
 """
 
+import bisect
+import itertools
 import logging
+import operator
+import sys
+from collections.abc import Iterator
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.request import ACCEPT_ENCODING
+from urllib3.util.retry import Retry
+
+from api.observations import Observation
 
 logger = logging.getLogger(__name__)
 
 NBER_BASE = "https://data.nber.org/databases/macrohistory/data"
 
-# Cache series info (description) by series_id to avoid refetching
-_series_info_cache: dict[str, dict] = {}
+# Frequency marker line -> freq (-1 annual, -4 quarterly, -12 monthly)
+_FREQ_MAP = {"-1": -1, "-4": -4, "-12": -12}
+
+# Missing-value spellings in .db files (lines arrive stripped and non-empty)
+_NA_TOKENS = frozenset(("NA", "na", "Na", "nA"))
+_NA = sys.intern("NA")
+
+_obs_date = operator.attrgetter("date")
+
+# Month-day suffix of each period within a year, by frequency marker
+_DATE_SUFFIXES = {
+    -1: ("-01-01",),
+    -4: ("-01-01", "-04-01", "-07-01", "-10-01"),
+    -12: tuple(f"-{m:02d}-01" for m in range(1, 13)),
+}
+
+def _make_session() -> requests.Session:
+    """Build the shared Session: keep-alive pool, compressed responses, retry on transient 5xx."""
+    session = requests.Session()
+    # .db files are plain text and compress well; br is listed only if a decoder is installed
+    session.headers["Accept-Encoding"] = ACCEPT_ENCODING
+    adapter = HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=16,
+        max_retries=Retry(total=2, backoff_factor=0.2, status_forcelist=[502, 503, 504], allowed_methods=["GET"]),
+    )
+    session.mount("https://", adapter)
+    return session
+
+
+# Shared keep-alive Session: all fetches to data.nber.org reuse pooled TLS connections
+_session = _make_session()
+
+# (connect, read) timeout: fail fast on an unreachable host, allow slow large downloads
+_TIMEOUT = (5, 30)
 
 
 def _parse_description(content: str) -> str:
@@ -31,142 +74,174 @@ def _parse_description(content: str) -> str:
 def get_series_info(series_id: str) -> dict:
     """
     Fetch NBER series metadata (e.g. description from .db comment).
-    Returns {"description": "..."}. Cached by series_id.
+    Returns {"description": "..."}. Cached by series_id in memory and on disk (NBER files don't change).
+    A failed fetch returns an empty description and is not cached, so the next call tries again.
     """
-    if series_id in _series_info_cache:
-        return _series_info_cache[series_id]
-    url = f"{NBER_BASE}/{series_id}.db"
-    try:
-        resp = requests.get(url, timeout=30)
+    from api import cache_disk
+    from api.cache import get_or_fetch
+
+    def _fetch() -> dict:
+        disk_key = f"nber_info:{series_id}"
+        info = cache_disk.get(disk_key)
+        if info is not None:
+            return info
+        resp = _session.get(f"{NBER_BASE}/{series_id}.db", timeout=_TIMEOUT)
         resp.raise_for_status()
-    except Exception as e:
+        info = {"description": _parse_description(resp.text)}
+        cache_disk.set(disk_key, info)
+        return info
+
+    try:
+        return get_or_fetch("nber_info", series_id, "", "", _fetch)
+    except requests.RequestException as e:
         logger.warning("NBER series info fetch failed for %s: %s", series_id, e)
-        result = {"description": ""}
-        _series_info_cache[series_id] = result
-        return result
-    raw = resp.text
-    desc = _parse_description(raw)
-    result = {"description": desc}
-    _series_info_cache[series_id] = result
-    return result
+        return {"description": ""}
 
 
-def _parse_db_content(content: str) -> list[dict]:
+def _split_period(raw: str) -> tuple[int, float]:
+    """Split a .db start/end line ("1862.", "1930.25") into (year, fraction of year)."""
+    year, _, frac = raw.partition(".")
+    return int(year), float("0." + frac) if frac else 0.0
+
+
+def _parse_db_lines(lines: Iterator[str]) -> list[Observation]:
     """
-    Parse NBER .db format: comment lines, then -1 (annual) / -4 (quarterly) / -12 (monthly),
-    then start/end lines (e.g. 1862. / 1930.), then one value per line. NA = missing.
-    Returns list of {"date": "YYYY-MM-DD", "value": str}.
+    Parse NBER .db format from an iterator of stripped, non-empty lines: comment lines, then
+    -1 (annual) / -4 (quarterly) / -12 (monthly), then start/end lines (e.g. 1862. / 1930.),
+    then one value per line. NA = missing. Reads only as many value lines as the start/end
+    range covers, so a streamed response is never consumed past the data.
+    Returns list of Observation(date="YYYY-MM-DD", value=str).
     """
-    lines = [ln.strip() for ln in content.strip().splitlines() if ln.strip()]
-    # Find frequency and start/end
+    # Header phase: skip comments until the frequency marker
     freq = None
-    start_line = None
-    for i, ln in enumerate(lines):
-        if ln in ("-1", "-4", "-12"):
-            freq = int(ln)
-            if i + 2 < len(lines):
-                start_line = i + 1
-            break
-        if ln.startswith('"'):
+    for ln in lines:
+        if ln[0] == '"':
             continue
-        try:
-            int(ln)
+        freq = _FREQ_MAP.get(ln)
+        if freq is not None:
             break
-        except ValueError:
-            continue
-
-    if freq is None or start_line is None:
+        if ln.lstrip("+-").isdigit():
+            # Some other integer before any frequency marker: not a series file we understand
+            break
+    if freq is None:
         return []
 
-    start_str = lines[start_line].rstrip(".")
-    end_str = lines[start_line + 1].rstrip(".")
+    # Range phase: start and end lines
+    start_raw = next(lines, None)
+    end_raw = next(lines, None)
+    if start_raw is None or end_raw is None:
+        return []
     try:
-        start_y = int(float(start_str))
-        end_y = int(float(end_str))
-        # Subperiod only for quarterly/monthly (e.g. 1930.25 = Q2)
-        start_sub = 1
-        end_sub = 1
-        if abs(freq) == 4:
-            end_sub = 4
-        elif abs(freq) == 12:
-            end_sub = 12
-        if "." in lines[start_line]:
-            start_sub = max(1, min(int(round((float(start_str) % 1) * abs(freq))) or 1, abs(freq)))
-        if "." in lines[start_line + 1] and abs(freq) in (4, 12):
-            end_sub = max(1, min(int(round((float(end_str) % 1) * abs(freq))) or abs(freq), abs(freq)))
-    except (ValueError, IndexError):
+        start_y, start_frac = _split_period(start_raw)
+        end_y, end_frac = _split_period(end_raw)
+    except ValueError:
         return []
+    # Subperiod only for quarterly/monthly (e.g. 1930.25 = Q2); a whole year spans all subperiods
+    per_year = -freq
+    start_sub = max(1, min(int(round(start_frac * per_year)) or 1, per_year)) if start_frac else 1
+    end_sub = max(1, min(int(round(end_frac * per_year)) or per_year, per_year)) if end_frac else per_year
 
-    value_lines = lines[start_line + 2 :]
-    obs = []
-    y, sub = start_y, start_sub
-    for v in value_lines:
-        is_na = (v or "").strip().upper() == "NA" or not (v or "").strip()
-        if freq == -1:
-            date_str = f"{y}-01-01"
-            obs.append({"date": date_str, "value": v.strip() if not is_na else "NA"})
-            y += 1
-        elif freq == -4:
-            month = (sub - 1) * 3 + 1
-            date_str = f"{y}-{month:02d}-01"
-            obs.append({"date": date_str, "value": v.strip() if not is_na else "NA"})
-            sub += 1
-            if sub > 4:
-                sub = 1
-                y += 1
-        else:  # -12 monthly
-            date_str = f"{y}-{sub:02d}-01"
-            obs.append({"date": date_str, "value": v.strip() if not is_na else "NA"})
-            sub += 1
-            if sub > 12:
-                sub = 1
-                y += 1
-        if y > end_y or (y == end_y and ((freq == -12 and sub > end_sub) or (freq == -4 and sub > end_sub))):
-            break
-    return obs
+    # Value phase: number of periods between start and end inclusive; trailing lines past end are ignored
+    n = max(1, (end_y - start_y) * per_year + end_sub - start_sub + 1)
+    values = [(_NA if v in _NA_TOKENS else v) for v in itertools.islice(lines, n)]
+    n = len(values)
+    if n == 0:
+        return []
+    # Date axis: each year string is formatted once and joined with precomputed "-MM-01" suffixes.
+    # Dates are interned: cached series over the same era share one string per date.
+    suffixes = _DATE_SUFFIXES[freq]
+    first = start_sub - 1
+    years = [str(y) for y in range(start_y, start_y + (first + n - 1) // per_year + 1)]
+    dates = [sys.intern(y + sfx) for y in years for sfx in suffixes][first : first + n]
+    return [Observation(d, v) for d, v in zip(dates, values)]
 
 
-def get_observations(
-    series_id: str,
-    start_date: str,
-    end_date: str,
-) -> list[dict]:
-    """
-    Fetch NBER Macrohistory series and return observations in range.
-    series_id: path like "01/a01005a" (chapter/filename without .db).
-    start_date, end_date: YYYY-MM-DD.
-    Returns list of {"date": "YYYY-MM-DD", "value": "..."}.
-    """
+def _parse_db_content(content: str) -> list[Observation]:
+    """Parse a whole .db file held in memory (see _parse_db_lines)."""
+    return _parse_db_lines(ln.strip() for ln in content.splitlines() if ln.strip())
+
+
+def _fetch_full_series(series_id: str) -> list[Observation]:
+    """Download and parse a whole NBER .db series (all dates)."""
     url = f"{NBER_BASE}/{series_id}.db"
     try:
-        resp = requests.get(url, timeout=30)
+        resp = _session.get(url, timeout=_TIMEOUT, stream=True)
         resp.raise_for_status()
     except Exception as e:
         logger.warning("NBER fetch failed for %s: %s", series_id, e)
         raise
 
-    raw = resp.text
-    all_obs = _parse_db_content(raw)
-    if not all_obs:
-        return []
+    # Parse line by line off the socket instead of buffering resp.text and splitting it
+    with resp:
+        if resp.encoding is None:
+            resp.encoding = "utf-8"
+        lines = resp.iter_lines(decode_unicode=True)
+        return _parse_db_lines(ln.strip() for ln in lines if ln and ln.strip())
 
-    out = [o for o in all_obs if start_date <= o["date"] <= end_date]
-    logger.info("NBER series_id=%s start=%s end=%s n_obs=%s", series_id, start_date, end_date, len(out))
+
+def _get_full_series_cached(series_id: str) -> list[Observation]:
+    """
+    Whole series from the in-memory cache, backed by the on-disk cache so series survive
+    restarts (NBER data is historical and never changes). One entry per series serves
+    every date window.
+    """
+    from api import cache_disk
+    from api.cache import get_or_fetch
+
+    def _fetch() -> list[Observation]:
+        disk_key = f"nber:{series_id}"
+        obs = cache_disk.get(disk_key)
+        if obs is None:
+            obs = _fetch_full_series(series_id)
+            if obs:
+                cache_disk.set(disk_key, obs)
+        return obs
+
+    return get_or_fetch("nber", series_id, "", "", _fetch)
+
+
+def _in_range(all_obs: list[Observation], series_id: str, start_date: str, end_date: str) -> list[Observation]:
+    """
+    Observations with start_date <= date <= end_date. The parser emits dates in order and ISO
+    dates compare as strings, so the window is located by binary search and sliced.
+    """
+    lo = bisect.bisect_left(all_obs, start_date, key=_obs_date)
+    hi = bisect.bisect_right(all_obs, end_date, lo=lo, key=_obs_date)
+    out = all_obs[lo:hi]
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("NBER series_id=%s start=%s end=%s n_obs=%s", series_id, start_date, end_date, len(out))
     return out
 
 
+def get_observations(
+    series_id: str,
+    start_date: str,
+    end_date: str,
+) -> list[Observation]:
+    """
+    Fetch NBER Macrohistory series and return observations in range.
+    series_id: path like "01/a01005a" (chapter/filename without .db).
+    start_date, end_date: YYYY-MM-DD.
+    Returns list of Observation(date="YYYY-MM-DD", value="...").
+    """
+    return _in_range(_fetch_full_series(series_id), series_id, start_date, end_date)
+
+
 def get_observations_cached(
     series_id: str,
     start_date: str,
     end_date: str,
-) -> list[dict]:
-    """Same as get_observations but uses in-memory cache."""
-    from api.cache import get_or_fetch
+) -> list[Observation]:
+    """
+    Same as get_observations, but the full series is cached (memory + disk) and the date
+    window is cut from it, so new windows on a known series need no fetch or parse.
+    """
+    return _in_range(_get_full_series_cached(series_id), series_id, start_date, end_date)
 
-    def _fetch() -> list[dict]:
-        return get_observations(series_id, start_date, end_date)
 
-    return get_or_fetch("nber", series_id, start_date, end_date, _fetch)
+def close() -> None:
+    """Release pooled connections (e.g. at app shutdown); they reopen on use."""
+    _session.close()
 
 
 if __name__ == "__main__":
@@ -176,7 +251,7 @@ if __name__ == "__main__":
     content = '" Index of crop production\n-1\n1862.\n1930.\n' + "\n".join(str(v) for v in vals) + "\nNA\nNA\nNA\nNA\nNA\nNA"
     obs = _parse_db_content(content)
     assert len(obs) == num_years, f"expected {num_years} obs, got {len(obs)}"
-    assert obs[0]["date"] == "1862-01-01", obs[0]["date"]
-    assert obs[-1]["date"] == "1930-01-01", obs[-1]["date"]
-    assert obs[-1]["value"] == "NA", obs[-1]["value"]
-    print("parse ok: first", obs[0]["date"], "last", obs[-1]["date"], "count", len(obs))
+    assert obs[0].date == "1862-01-01", obs[0].date
+    assert obs[-1].date == "1930-01-01", obs[-1].date
+    assert obs[-1].value == "NA", obs[-1].value
+    print("parse ok: first", obs[0].date, "last", obs[-1].date, "count", len(obs))
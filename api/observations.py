@@ -0,0 +1,14 @@
+"""
+Observation record shared by the API clients (FRED, Google Trends, NBER).
+A NamedTuple instead of a {date, value} dict: roughly a third of the memory per row,
+which matters for long series held in the response cache.
+"""
+
+from typing import NamedTuple
+
+
+class Observation(NamedTuple):
+    """One time-series point. date is YYYY-MM-DD; value is the raw string ("." / "NA" = missing)."""
+
+    date: str
+    value: str
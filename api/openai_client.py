@@ -0,0 +1,62 @@
+"""
+Shared OpenAI clients, one per API key for the whole process. Seed generation and guess
+evaluation reuse them so their HTTP connection pools (keep-alive, TLS sessions) stay warm.
+The openai package is imported on first use, so importing this module is free.
+"""
+
+import os
+import threading
+
+# Seconds per connect/read/write: for streamed replies this bounds the wait between chunks, not the
+# whole reply. Timeouts, 429 and 5xx are retried by the SDK with jittered exponential backoff;
+# 401/403 are not retried.
+OPENAI_TIMEOUT = float(os.environ.get("OPENAI_TIMEOUT", "8"))
+OPENAI_MAX_RETRIES = int(os.environ.get("OPENAI_MAX_RETRIES", "2"))
+
+# api_key -> client; created on first use, dropped by aclose_clients()
+_clients: dict[str, object] = {}
+_async_clients: dict[str, object] = {}
+_lock = threading.Lock()
+
+
+def get_client(api_key: str):
+    """Return the process-wide OpenAI client for api_key (created on first use; thread-safe)."""
+    client = _clients.get(api_key)
+    if client is None:
+        with _lock:
+            client = _clients.get(api_key)
+            if client is None:
+                from openai import OpenAI
+
+                client = _clients[api_key] = OpenAI(
+                    api_key=api_key, timeout=OPENAI_TIMEOUT, max_retries=OPENAI_MAX_RETRIES
+                )
+    return client
+
+
+def get_async_client(api_key: str):
+    """Return the process-wide AsyncOpenAI client for api_key (created on first use)."""
+    client = _async_clients.get(api_key)
+    if client is None:
+        with _lock:
+            client = _async_clients.get(api_key)
+            if client is None:
+                from openai import AsyncOpenAI
+
+                client = _async_clients[api_key] = AsyncOpenAI(
+                    api_key=api_key, timeout=OPENAI_TIMEOUT, max_retries=OPENAI_MAX_RETRIES
+                )
+    return client
+
+
+async def aclose_clients() -> None:
+    """Close every cached client and its connection pool (e.g. at app shutdown)."""
+    with _lock:
+        clients = list(_clients.values())
+        async_clients = list(_async_clients.values())
+        _clients.clear()
+        _async_clients.clear()
+    for client in clients:
+        client.close()
+    for client in async_clients:
+        await client.close()
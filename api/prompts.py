@@ -3,18 +3,21 @@ Centralized prompts for LLM calls. Helper functions build prompt text so we can
 edit and tune them in one place; callers pass in dynamic data and use the returned string.
 """
 
+import functools
+import os
 import random
+import threading
 
 
 # Era suggestions to rotate and reduce repeated trends (FRED and Google Trends)
-ERA_SUGGESTIONS = [
+ERA_SUGGESTIONS = (
     "Focus on the early 1980s (1980-1983): Volcker recession, inflation fighting.",
     "Focus on the early 1990s (1990-1992): 1990-1991 recession.",
     "Focus on 2000-2003: Dot-com bust, 2001 recession, 9/11 aftermath.",
     "Focus on 2007-2010: 2008 financial crisis, Great Recession, housing crash.",
     "Focus on 2011-2015: Eurozone crisis, oil price swings, taper tantrum.",
     "Focus on a specific policy or shock (e.g. oil crisis, Fed rate cycle) rather than the same events every time.",
-]
+)
 
 # FRED API: typical date range for US macro series (many start 1948; end is real-time).
 # Per-series ranges vary; this keeps the LLM from picking dates outside common coverage.
@@ -22,46 +25,32 @@ FRED_DATE_START = "1948-01-01"
 FRED_DATE_END_HINT = "the latest available (e.g. 2024-12-31 or current year)"
 
 # NBER Macrohistory: historical eras (1860s–1940s)
-NBER_ERA_SUGGESTIONS = [
+NBER_ERA_SUGGESTIONS = (
     "Focus on 1929-1933: Great Depression, stock market crash.",
     "Focus on 1893-1897: Panic of 1893 and aftermath.",
     "Focus on 1907-1908: Panic of 1907.",
     "Focus on 1914-1918: World War I.",
     "Focus on 1920-1921: Post-WWI recession.",
-]
+)
 
+_ERA_BY_SOURCE = {
+    "fred": ERA_SUGGESTIONS,
+    "google_trends": ERA_SUGGESTIONS,
+    "nber": NBER_ERA_SUGGESTIONS,
+}
 
-def build_puzzle_seed_prompt(
-    *,
-    requested_source: str,
-    series_list: str,
-    examples_str: str,
-    user_preference: str | None = None,
-    fred_releases_list: str | None = None,
-) -> str:
-    """
-    Build the prompt for generating a single puzzle seed (FRED, Google Trends, or NBER).
-    Call from seed_generator when calling the LLM. Designed for variety and robustness.
-    If user_preference is set, the LLM must tailor the puzzle to that preference.
-    """
-    era_hint = (
-        random.choice(NBER_ERA_SUGGESTIONS)
-        if requested_source == "nber"
-        else random.choice(ERA_SUGGESTIONS)
-    )
-
-    if requested_source == "fred":
-        discovery_instruction = ""
-        if fred_releases_list:
-            discovery_instruction = f"""
+# Per-source instruction templates, built once; only series_list / era_hint /
+# fred_releases_list are filled in per call (str.format placeholders).
+_FRED_DISCOVERY_INSTRUCTION = """
 - You MAY use discovery instead of seriesId. Choose ONE of:
   A) seriesId: from this list ONLY: {series_list}
   B) fredDiscovery: "search" and searchText: a topic (e.g. "unemployment rate", "housing starts", "industrial production"). Do not set seriesId.
   C) fredDiscovery: "release" and releaseId: from this list (use the numeric id): {fred_releases_list}
 If using B or C, omit seriesId. If using A, omit fredDiscovery, searchText, and releaseId."""
-        else:
-            discovery_instruction = f"\n- seriesId: from this list ONLY: {series_list}"
-        source_instruction = f'''You MUST output a FRED seed with "source": "fred".{discovery_instruction}
+
+_FRED_SERIES_INSTRUCTION = "\n- seriesId: from this list ONLY: {series_list}"
+
+_FRED_INSTRUCTION = f'''You MUST output a FRED seed with "source": "fred".{{discovery_instruction}}
 - startDate, endDate: YYYY-MM-DD. FRED date range: use dates between {FRED_DATE_START} and {FRED_DATE_END_HINT}. Do not use dates outside this range or the series will have no data.
 - correctEvent, acceptableAnswers (list), explanation, hints (array of 4 strings, increasingly obvious)
 
@@ -70,25 +59,99 @@ Variety rules:
 - Try to pick unique and unusual events (e.g. Panic of 1893, World War I, Great Depression), events like oil crash are too common, if you use these events, they should be unique in the way they occured.
 - The events should be able to be described by a name, not just a vague time period.
 - Prefer different events (e.g. 1980s recession, dot-com bust, 1990s recession, 2008 crisis) and vary the decade.
-- This time: {era_hint}'''
-    elif requested_source == "nber":
-        source_instruction = f'''You MUST output an NBER Macrohistory seed with "source": "nber".
+- This time: {{era_hint}}'''
+
+_SOURCE_INSTRUCTIONS = {
+    # (requested_source, has fred_releases_list) -> template
+    ("fred", True): _FRED_INSTRUCTION.replace("{discovery_instruction}", _FRED_DISCOVERY_INSTRUCTION),
+    ("fred", False): _FRED_INSTRUCTION.replace("{discovery_instruction}", _FRED_SERIES_INSTRUCTION),
+    ("nber", False): '''You MUST output an NBER Macrohistory seed with "source": "nber".
 - seriesId: from this list ONLY (format chapter/filename, e.g. 01/a01005a): {series_list}
 - startDate, endDate: YYYY-MM-DD (NBER data is mostly 1860s–1940s; pick a range within the series coverage)
 - correctEvent, acceptableAnswers (list), explanation, hints (array of 4 strings, increasingly obvious)
 
 NBER data is historical (1800s–1940s). Pick a well-known causal event in that era, e.g.:
 Panic of 1893, Panic of 1907, World War I, post-WWI recession, Great Depression (1929–1933), New Deal era, Dust Bowl.
-- This time: {era_hint}'''
-    else:
-        source_instruction = f'''You MUST output a Google Trends seed with "source": "google_trends".
+- This time: {era_hint}''',
+    ("google_trends", False): '''You MUST output a Google Trends seed with "source": "google_trends".
 - searchTerm: a phrase people actually search (e.g. "bankruptcy", "foreclosure", "gold price", "oil crisis", "recession", "layoffs")
 - startDate, endDate: YYYY-MM-DD
 - correctEvent, acceptableAnswers (list), explanation, hints (array of 4 strings, increasingly obvious)
 
 Variety rules:
 - Pick a UNIQUE search term and event: do not repeat toilet paper, face mask, or COVID. Vary the decade and type of event.
-- This time: {era_hint}'''
+- This time: {era_hint}''',
+}
+
+# Thread-local random.Random instances (see _rng)
+_rng_local = threading.local()
+
+
+def _rng() -> random.Random:
+    """Per-thread RNG (seeded from os.urandom) so concurrent requests don't share the global one."""
+    r = getattr(_rng_local, "rng", None)
+    if r is None:
+        r = _rng_local.rng = random.Random(os.urandom(8))
+    return r
+
+
+@functools.lru_cache(maxsize=4)
+def _seed_prompt_prefix(examples_str: str) -> str:
+    """Static head of the seed prompt (role, output format, few-shot examples); identical across calls."""
+    return f"""You are creating a single "causal guessr" puzzle: a time-series chart where the player must guess what real-world event caused the trend. They get 4 guesses and a hint after each wrong guess. Do not give away the answer until the 4th hint.
+
+Each seed is one JSON object with the required keys. No other text, no markdown, no code block.
+Examples of single seeds (format only; do not copy content—pick different series/terms, dates, and events):
+{examples_str}
+
+"""
+
+
+@functools.lru_cache(maxsize=128)
+def _source_instruction(
+    requested_source: str, series_list: str, era_hint: str, fred_releases_list: str | None
+) -> str:
+    """Rendered per-source instructions. Inputs come from small constant sets, so every variant is reused."""
+    template = _SOURCE_INSTRUCTIONS[
+        (requested_source, requested_source == "fred" and bool(fred_releases_list))
+    ]
+    return template.format(
+        series_list=series_list,
+        era_hint=era_hint,
+        fred_releases_list=fred_releases_list,
+    )
+
+
+@functools.lru_cache(maxsize=8)
+def _reply_instruction(count: int) -> str:
+    """Closing output instruction for a reply holding count seeds."""
+    if count > 1:
+        return (
+            f'Reply with only a JSON object of the form {{"seeds": [...]}} holding {count} distinct seeds, '
+            "each about a different event and date range."
+        )
+    return "Reply with only the JSON object."
+
+
+def build_puzzle_seed_prompt(
+    *,
+    requested_source: str,
+    series_list: str,
+    examples_str: str,
+    user_preference: str | None = None,
+    fred_releases_list: str | None = None,
+    count: int = 1,
+) -> str:
+    """
+    Build the prompt for generating puzzle seeds (FRED, Google Trends, or NBER).
+    Call from seed_generator when calling the LLM. Designed for variety and robustness.
+    If user_preference is set, the LLM must tailor the puzzle to that preference.
+    count > 1 asks for {"seeds": [...]} with that many distinct seeds in one reply.
+    """
+    if requested_source not in ("fred", "nber"):
+        requested_source = "google_trends"
+    era_hint = _rng().choice(_ERA_BY_SOURCE[requested_source])
+    source_instruction = _source_instruction(requested_source, series_list, era_hint, fred_releases_list)
 
     preference_instruction = ""
     if user_preference and user_preference.strip():
@@ -96,15 +159,10 @@ Variety rules:
 
 User preference (you MUST follow this when picking the event and date range): {user_preference.strip()}"""
 
-    return f"""You are creating a single "causal guessr" puzzle: a time-series chart where the player must guess what real-world event caused the trend. They get 4 guesses and a hint after each wrong guess. Do not give away the answer until the 4th hint.
-
-{source_instruction}{preference_instruction}
-
-Output exactly one JSON object with the required keys. No other text, no markdown, no code block.
-Examples (format only; do not copy content—pick different series/terms, dates, and events):
-{examples_str}
+    # Stable prefix first, per-call instructions last: lets provider-side prompt caching reuse the prefix
+    return f"""{_seed_prompt_prefix(examples_str)}{source_instruction}{preference_instruction}
 
-Reply with only the JSON object."""
+{_reply_instruction(count)}"""
 
 
 def build_guess_evaluation_prompt(
@@ -4,22 +4,95 @@ the LLM picks a FRED series and date range plus the causal event and acceptable
 Falls back to a random seed from puzzle_seeds.json if the LLM fails (e.g. quota, no key).
 """
 
+import asyncio
+import copy
+import hashlib
+import importlib.util
 import json
 import logging
+import math
 import os
 import random
-import re
+import threading
+import time
+from collections import OrderedDict, deque
+from collections.abc import AsyncIterator, Iterator
+from datetime import date
 from pathlib import Path
 
-from dotenv import load_dotenv
+from api.openai_client import OPENAI_TIMEOUT, get_async_client, get_client
+
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+
+    def _json_dumps_indent(obj) -> str:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+
+except ImportError:  # stdlib fallback; same output, slower
+    _json_loads = json.loads
+
+    def _json_dumps_indent(obj) -> str:
+        return json.dumps(obj, indent=2, ensure_ascii=False, separators=(",", ": "))
 
-load_dotenv(Path(__file__).resolve().parent.parent / ".env")
 
 logger = logging.getLogger(__name__)
 
 PROJECT_ROOT = Path(__file__).resolve().parent.parent
 PUZZLE_SEEDS_PATH = PROJECT_ROOT / "puzzle_seeds.json"
 
+# .env is read on the first LLM call, not at import (fallback-only users never touch it).
+# The sanitized OpenAI key and model are read from the environment at the same time, once.
+_dotenv_loaded = False
+_api_key: str | None = None
+_model = "gpt-4o-mini"
+
+# (mtime_ns, parsed puzzle_seeds.json): reloaded when the file changes; callers get copies
+_seeds_cache: tuple[int, list[dict]] | None = None
+_seeds_cache_lock = threading.Lock()
+
+# Checked once: whether the openai package is installed (found without importing it, which is slow)
+_OPENAI_AVAILABLE = importlib.util.find_spec("openai") is not None
+
+# Thread-local random.Random instances (see _rng)
+_rng_local = threading.local()
+
+# LLM seed cache: validated seeds bucketed by hash of model + prompt (source, era hint, preference).
+# Only the first seed of each LLM batch is cached (the rest are served once, via the seed queue).
+# A bucket only serves hits once it holds SEED_CACHE_BUCKET_SIZE distinct seeds, so output
+# stays varied; 0 disables the cache. Even then only SEED_CACHE_HIT_RATE of misses on the queue
+# are answered from it: the others still call the LLM, and the new seed replaces a random cached
+# one, so the bucket keeps rotating. At most _SEED_CACHE_MAX_BUCKETS prompts are kept (LRU).
+# A bucket expires SEED_CACHE_TTL seconds after its first seed (0 = never), then refills from the LLM.
+SEED_CACHE_BUCKET_SIZE = int(os.environ.get("SEED_CACHE_BUCKET_SIZE", "8"))
+SEED_CACHE_HIT_RATE = float(os.environ.get("SEED_CACHE_HIT_RATE", "0.5"))
+SEED_CACHE_TTL = float(os.environ.get("SEED_CACHE_TTL", "86400"))
+_SEED_CACHE_MAX_BUCKETS = 512
+# key -> (expires at, wall clock; seeds)
+_seed_cache: "OrderedDict[str, tuple[float, list[dict]]]" = OrderedDict()
+_seed_cache_lock = threading.Lock()
+# Bump when seed validation or post-processing changes so cached (incl. on-disk) buckets are dropped.
+# Prompt text is part of the key already, so edits to prompts or FEW_SHOT_SEEDS invalidate on their own.
+SEED_TEMPLATE_VERSION = 2
+
+# Seed batching: one LLM call asks for SEED_BATCH_SIZE seeds; the extras wait in a bounded
+# queue per (requested source, user preference) and are served to later calls without a request.
+SEED_BATCH_SIZE = max(1, int(os.environ.get("SEED_BATCH_SIZE", "8")))
+# Output cap per requested seed (a seed with 4 hints is ~150-200 tokens); bounds decode time
+_SEED_MAX_TOKENS_PER_SEED = 300
+_SEED_QUEUE_MAX = max(32, 2 * SEED_BATCH_SIZE)
+_SEED_MAX_QUEUES = 256
+_seed_queues: "OrderedDict[tuple[str, str], deque[dict]]" = OrderedDict()
+_refill_locks: dict[tuple[str, str], threading.Lock] = {}
+_seed_queues_lock = threading.Lock()
+# Background drain tasks of generate_puzzle_seed_async, referenced so they are not GC'd mid-stream
+_drain_tasks: set[asyncio.Task] = set()
+# Async counterpart of _refill_locks: qkey -> Condition of the batch currently streaming into that
+# queue, notified on every queued seed and when the stream ends (entry removed then). Concurrent
+# async misses wait on it instead of each sending a request. Touched only on the event loop.
+_async_refills: dict[tuple[str, str], asyncio.Condition] = {}
+
 # Known FRED series that have clear causal stories (unemployment, GDP, rates, etc.)
 FRED_SERIES_EXAMPLES = [
     "UNRATE", "ICSA", "GDPC1", "GDP", "INDPRO", "RSXFS", "PAYEMS", "HOUST",
@@ -98,13 +171,32 @@ FEW_SHOT_SEEDS = [
     },
 ]
 
+# Prompt pieces derived from the constants above, serialized once at import
+# Serialized once: the examples are part of the static prompt prefix, so they must be byte-stable
+_FEW_SHOT_SEEDS_JSON = _json_dumps_indent(FEW_SHOT_SEEDS)
+_FRED_SERIES_LIST_STR = ", ".join(FRED_SERIES_EXAMPLES)
+_NBER_SERIES_LIST_STR = ", ".join(NBER_SERIES_EXAMPLES)
+# (releases list, formatted string): get_releases_cached returns the same list for the process
+_releases_str_cache: tuple[list, str | None] | None = None
+
+
+def _rng() -> random.Random:
+    """Per-thread RNG (seeded from os.urandom) so concurrent requests don't share the global one."""
+    r = getattr(_rng_local, "rng", None)
+    if r is None:
+        r = _rng_local.rng = random.Random(os.urandom(8))
+    return r
+
 
 def _ensure_hints(seed: dict) -> dict:
     """Ensure seed has exactly 4 hints (increasingly obvious). Build from explanation/correctEvent if missing."""
     hints = seed.get("hints")
-    if isinstance(hints, list) and len(hints) >= 4:
-        seed["hints"] = hints[:4]
-        return seed
+    if isinstance(hints, list):
+        if len(hints) == 4:
+            return seed
+        if len(hints) > 4:
+            seed["hints"] = hints[:4]
+            return seed
     expl = seed.get("explanation") or ""
     event = seed.get("correctEvent") or "the correct event"
     seed["hints"] = [
@@ -116,27 +208,509 @@ def _ensure_hints(seed: dict) -> dict:
     return seed
 
 
+def _load_env() -> None:
+    """
+    Load PROJECT_ROOT/.env into os.environ once (python-dotenv imported only here) and cache
+    the OpenAI key (quotes/whitespace stripped) and model. The .env read is skipped when
+    OPENAI_API_KEY is already in the process environment or LOAD_DOTENV is not "1".
+    """
+    global _dotenv_loaded, _api_key, _model
+    if _dotenv_loaded:
+        return
+    if os.environ.get("LOAD_DOTENV", "1") == "1" and not os.environ.get("OPENAI_API_KEY"):
+        from dotenv import load_dotenv
+
+        load_dotenv(PROJECT_ROOT / ".env")
+    _api_key = (os.environ.get("OPENAI_API_KEY") or "").strip().strip('"').strip("'") or None
+    _model = os.environ.get("OPENAI_MODEL", "gpt-4o-mini")
+    _dotenv_loaded = True
+
+
+def reload_env() -> None:
+    """Re-read .env and OPENAI_API_KEY / OPENAI_MODEL (e.g. after tests change the environment)."""
+    global _dotenv_loaded
+    _dotenv_loaded = False
+    _load_env()
+
+
+def _prompt_key(model: str, prompt: str) -> str:
+    """Short stable hash of (template version, model, prompt), used as the seed cache bucket key."""
+    raw = f"{SEED_TEMPLATE_VERSION}\0{model}\0{prompt}"
+    return hashlib.blake2b(raw.encode(), digest_size=16).hexdigest()
+
+
+def _get_bucket(key: str) -> tuple[float, list[dict]] | None:
+    """
+    Live (expires, bucket) entry for key from memory, else from the disk cache (promoted into
+    memory). Expired entries are dropped. Caller holds the lock.
+    """
+    entry = _seed_cache.get(key)
+    if entry is None:
+        from api import cache_disk
+
+        entry = cache_disk.get(f"llm_seed:{key}")
+        if entry is None:
+            return None
+        _seed_cache[key] = entry
+        while len(_seed_cache) > _SEED_CACHE_MAX_BUCKETS:
+            _seed_cache.popitem(last=False)
+    if entry[0] <= time.time():
+        del _seed_cache[key]
+        return None
+    _seed_cache.move_to_end(key)
+    return entry
+
+
+def _cached_llm_seed(key: str) -> dict | None:
+    """
+    Return a copy of a random cached seed for this prompt if its bucket is full, else None.
+    Also None for a (1 - SEED_CACHE_HIT_RATE) share of calls, which go to the LLM instead.
+    """
+    if SEED_CACHE_BUCKET_SIZE <= 0 or _rng().random() >= SEED_CACHE_HIT_RATE:
+        return None
+    with _seed_cache_lock:
+        entry = _get_bucket(key)
+        if entry is None or len(entry[1]) < SEED_CACHE_BUCKET_SIZE:
+            return None
+        seed = _rng().choice(entry[1])
+    return copy.deepcopy(seed)
+
+
+def _store_llm_seed(key: str, seed: dict) -> None:
+    """
+    Add a validated LLM seed to its prompt bucket (bounded; least recently used bucket evicted)
+    and write the bucket through to the disk cache so it survives restarts. Once the bucket is
+    full the seed replaces a random entry.
+    """
+    if SEED_CACHE_BUCKET_SIZE <= 0:
+        return
+    from api import cache_disk
+
+    seed = copy.deepcopy(seed)
+    with _seed_cache_lock:
+        entry = _get_bucket(key)
+        if entry is None:
+            expires = time.time() + SEED_CACHE_TTL if SEED_CACHE_TTL > 0 else math.inf
+            entry = _seed_cache[key] = (expires, [])
+        expires, bucket = entry
+        if len(bucket) >= SEED_CACHE_BUCKET_SIZE:
+            bucket[_rng().randrange(len(bucket))] = seed
+        else:
+            bucket.append(seed)
+        snapshot = list(bucket)
+        while len(_seed_cache) > _SEED_CACHE_MAX_BUCKETS:
+            _seed_cache.popitem(last=False)
+    ttl = None if expires == math.inf else max(0.0, expires - time.time())
+    cache_disk.set(f"llm_seed:{key}", (expires, snapshot), ttl=ttl)
+
+
+def _load_seeds() -> list[dict]:
+    """
+    Return the parsed puzzle_seeds.json, re-reading it only when its mtime changes. Hints and
+    acceptableAnswers are normalized up front so a fallback pick is only a choice + copy.
+    Raises if file missing or empty.
+    """
+    global _seeds_cache
+    try:
+        mtime = PUZZLE_SEEDS_PATH.stat().st_mtime_ns
+    except FileNotFoundError:
+        raise FileNotFoundError("puzzle_seeds.json not found") from None
+    cached = _seeds_cache
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+    with _seeds_cache_lock:
+        if _seeds_cache is not None and _seeds_cache[0] == mtime:
+            return _seeds_cache[1]
+        with open(PUZZLE_SEEDS_PATH, "rb", buffering=65536) as f:
+            seeds = _json_loads(f.read())
+        if not seeds:
+            raise ValueError("puzzle_seeds.json is empty")
+        for seed in seeds:
+            _ensure_hints(seed)
+            answers = seed.get("acceptableAnswers")
+            if not isinstance(answers, list):
+                seed["acceptableAnswers"] = [answers] if answers else []
+        _seeds_cache = (mtime, seeds)
+    return seeds
+
+
 def _random_seed_from_file() -> dict:
     """Return a random puzzle seed from puzzle_seeds.json. Raises if file missing or empty."""
-    if not PUZZLE_SEEDS_PATH.exists():
-        raise FileNotFoundError("puzzle_seeds.json not found")
-    with open(PUZZLE_SEEDS_PATH) as f:
-        seeds = json.load(f)
-    if not seeds:
-        raise ValueError("puzzle_seeds.json is empty")
-    seed = random.choice(seeds)
-    if not isinstance(seed.get("acceptableAnswers"), list):
-        seed["acceptableAnswers"] = [seed["acceptableAnswers"]] if seed.get("acceptableAnswers") else []
+    seeds = _load_seeds()
+    picked = seeds[_rng().randrange(len(seeds))]
+    # Seeds hold only strings and lists of strings: copying the lists keeps the cached one intact
+    seed = {k: (list(v) if isinstance(v, list) else v) for k, v in picked.items()}
     seed["seed_source"] = "fallback"
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(
+            "seed_source=fallback seriesId=%s startDate=%s endDate=%s correctEvent=%s",
+            seed.get("seriesId"),
+            seed.get("startDate"),
+            seed.get("endDate"),
+            seed.get("correctEvent"),
+        )
+    return seed
+
+
+def _queue_key(requested_source: str, user_preference: str | None) -> tuple[str, str]:
+    """Queue key: seeds are only interchangeable for the same source and preference."""
+    return requested_source, (user_preference or "").strip().lower()
+
+
+def _pop_queued_seed(qkey: tuple[str, str]) -> dict | None:
+    """Take the next prefetched seed for qkey, or None if its queue is empty."""
+    with _seed_queues_lock:
+        queue = _seed_queues.get(qkey)
+        if not queue:
+            return None
+        _seed_queues.move_to_end(qkey)
+        return queue.popleft()
+
+
+def _push_queued_seeds(qkey: tuple[str, str], seeds: list[dict]) -> None:
+    """Queue prefetched seeds for later calls (bounded per key and in number of keys)."""
+    if not seeds:
+        return
+    with _seed_queues_lock:
+        queue = _seed_queues.get(qkey)
+        if queue is None:
+            queue = _seed_queues[qkey] = deque(maxlen=_SEED_QUEUE_MAX)
+        _seed_queues.move_to_end(qkey)
+        queue.extend(seeds)
+        while len(_seed_queues) > _SEED_MAX_QUEUES:
+            old_key, _ = _seed_queues.popitem(last=False)
+            # Keep a lock a refill still holds, or the next miss would start a second batch request
+            lock = _refill_locks.get(old_key)
+            if lock is not None and not lock.locked():
+                del _refill_locks[old_key]
+
+
+def _refill_lock(qkey: tuple[str, str]) -> threading.Lock:
+    """Per-key lock so concurrent misses share one batch request instead of each sending one."""
+    with _seed_queues_lock:
+        return _refill_locks.setdefault(qkey, threading.Lock())
+
+
+# Keys every LLM seed of a source must carry (FRED's seriesId may come from fredDiscovery instead)
+_COMMON_SEED_KEYS = ("startDate", "endDate", "correctEvent", "acceptableAnswers", "explanation")
+_REQUIRED_SEED_KEYS = {
+    "fred": _COMMON_SEED_KEYS,
+    "google_trends": ("searchTerm", *_COMMON_SEED_KEYS),
+    "nber": ("seriesId", *_COMMON_SEED_KEYS),
+}
+# Keys that must be strings when present (null allowed), so a malformed seed is rejected with ValueError
+_STRING_SEED_KEYS = ("source", "fredDiscovery", "searchText", "seriesId", "searchTerm", "correctEvent")
+
+
+def _parse_date_range(start, end) -> tuple[date, date]:
+    """Parse an LLM seed's startDate/endDate (YYYY-MM-DD). Raises ValueError if invalid or reversed."""
+    try:
+        start_date = date.fromisoformat(str(start).strip())
+        end_date = date.fromisoformat(str(end).strip())
+    except ValueError as e:
+        raise ValueError(f"LLM seed has an invalid date range {start!r}..{end!r}") from e
+    if start_date > end_date:
+        raise ValueError(f"LLM seed startDate {start_date} is after endDate {end_date}")
+    return start_date, end_date
+
+
+def _validate_llm_seed(seed: dict) -> dict:
+    """Check an LLM seed has the keys its source needs and normalize it. Raises ValueError."""
+    if not isinstance(seed, dict):
+        raise ValueError("LLM seed is not a JSON object")
+    for k in _STRING_SEED_KEYS:
+        if seed.get(k) is not None and not isinstance(seed[k], str):
+            raise ValueError(f"LLM seed {k} is not a string: {seed[k]!r}")
+    source = (seed.get("source") or "fred").strip().lower()
+    if source not in _REQUIRED_SEED_KEYS:
+        source = "fred"
+    for k in _REQUIRED_SEED_KEYS[source]:
+        if k not in seed:
+            raise ValueError(f"LLM seed missing key: {k}")
+    # Parsed once here so the rest of the app can compare the canonical ISO strings as dates
+    start_date, end_date = _parse_date_range(seed["startDate"], seed["endDate"])
+    seed["startDate"], seed["endDate"] = start_date.isoformat(), end_date.isoformat()
+    if source == "fred":
+        seed["source"] = "fred"
+        discovery = (seed.get("fredDiscovery") or "").strip().lower()
+        if discovery:
+            if discovery == "search" and not (seed.get("searchText") or "").strip():
+                raise ValueError("LLM FRED seed fredDiscovery=search missing searchText")
+            if discovery == "release":
+                rid = seed.get("releaseId") or seed.get("release_id")
+                if rid is None or (isinstance(rid, (int, float)) and rid <= 0):
+                    raise ValueError("LLM FRED seed fredDiscovery=release missing or invalid releaseId")
+        elif not (seed.get("seriesId") or "").strip():
+            raise ValueError("LLM FRED seed missing seriesId (or fredDiscovery + searchText/releaseId)")
+    if not isinstance(seed["acceptableAnswers"], list):
+        seed["acceptableAnswers"] = [seed["acceptableAnswers"]]
     _ensure_hints(seed)
+    seed["seed_source"] = "llm"
+    return seed
+
+
+def _parse_llm_seeds(text: str) -> list[dict]:
+    """
+    Parse an LLM reply into validated seeds. Accepts {"seeds": [...]}, a bare list, or a single
+    seed object; invalid entries are skipped. Raises ValueError if no seed is usable.
+    """
+    if "```" in text:
+        # Strip a ```json ... ``` fence (models without JSON mode); partition beats a regex here
+        _, _, rest = text.partition("```")
+        body, closed, _ = rest.partition("```")
+        if closed:
+            text = body.removeprefix("json").strip()
+    data = _json_loads(text)
+    if isinstance(data, dict) and isinstance(data.get("seeds"), list):
+        items = data["seeds"]
+    elif isinstance(data, list):
+        items = data
+    else:
+        items = [data]
+    seeds = []
+    last_error: ValueError | None = None
+    for item in items:
+        try:
+            seeds.append(_validate_llm_seed(item))
+        except ValueError as e:
+            last_error = e
+            logger.debug("Skipping invalid LLM seed: %s", e)
+    if not seeds:
+        raise last_error or ValueError("LLM returned no seeds")
+    return seeds
+
+
+class _SeedStreamParser:
+    """
+    Incremental scanner over a streamed LLM reply. Returns the text of each object directly
+    inside the first JSON array (the seeds in {"seeds": [...]}) as soon as its closing brace
+    arrives, so the first seed can be used before the rest of the reply is generated.
+    """
+
+    def __init__(self) -> None:
+        self._parts: list[str] = []
+        self._buf = ""
+        self._pos = 0
+        self._depth = 0
+        self._array_depth: int | None = None
+        self._obj_start: int | None = None
+        self._in_string = False
+        self._escape = False
+
+    @property
+    def text(self) -> str:
+        """Everything received so far."""
+        return "".join(self._parts)
+
+    def feed(self, piece: str) -> list[str]:
+        """Consume the next chunk; return the text of any seed objects it completed."""
+        self._parts.append(piece)
+        self._buf += piece
+        done = []
+        buf = self._buf
+        for i in range(self._pos, len(buf)):
+            c = buf[i]
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif c == "\\":
+                    self._escape = True
+                elif c == '"':
+                    self._in_string = False
+            elif c == '"':
+                self._in_string = True
+            elif c in "{[":
+                self._depth += 1
+                if c == "[" and self._array_depth is None:
+                    self._array_depth = self._depth
+                elif c == "{" and self._array_depth is not None and self._depth == self._array_depth + 1:
+                    self._obj_start = i
+            elif c in "}]":
+                if c == "}" and self._obj_start is not None and self._depth == self._array_depth + 1:
+                    done.append(buf[self._obj_start : i + 1])
+                    self._obj_start = None
+                self._depth -= 1
+        # Keep only the unfinished seed object (if any) buffered
+        keep_from = self._obj_start if self._obj_start is not None else len(buf)
+        self._buf = buf[keep_from:]
+        if self._obj_start is not None:
+            self._obj_start = 0
+        self._pos = len(self._buf)
+        return done
+
+
+def _seeds_from_chunk(parser: _SeedStreamParser, chunk) -> list[dict]:
+    """Feed one streamed completion chunk to parser; return the seeds it completed (invalid ones skipped)."""
+    if not chunk.choices:
+        return []
+    piece = chunk.choices[0].delta.content
+    if not piece:
+        return []
+    seeds = []
+    for obj_text in parser.feed(piece):
+        try:
+            seeds.append(_validate_llm_seed(_json_loads(obj_text)))
+        except ValueError as e:
+            logger.debug("Skipping invalid streamed LLM seed: %s", e)
+    return seeds
+
+
+def _iter_streamed_seeds(stream) -> Iterator[dict]:
+    """
+    Yield validated seeds from a streaming chat completion as each one completes. If the reply
+    has no seed array (e.g. a single object), parse the whole text at the end instead.
+    """
+    parser = _SeedStreamParser()
+    yielded = False
+    for chunk in stream:
+        for seed in _seeds_from_chunk(parser, chunk):
+            yielded = True
+            yield seed
+    if not yielded:
+        yield from _parse_llm_seeds(parser.text.strip())
+
+
+async def _aiter_streamed_seeds(stream) -> AsyncIterator[dict]:
+    """Async form of _iter_streamed_seeds for an AsyncOpenAI stream."""
+    parser = _SeedStreamParser()
+    yielded = False
+    async for chunk in stream:
+        for seed in _seeds_from_chunk(parser, chunk):
+            yielded = True
+            yield seed
+    if not yielded:
+        for seed in _parse_llm_seeds(parser.text.strip()):
+            yield seed
+
+
+def _log_seed(seed_source: str, seed: dict) -> None:
+    if not logger.isEnabledFor(logging.INFO):
+        return
     logger.info(
-        "seed_source=fallback seriesId=%s startDate=%s endDate=%s correctEvent=%s",
-        seed.get("seriesId"),
+        "seed_source=%s source=%s id=%s startDate=%s endDate=%s correctEvent=%s",
+        seed_source,
+        seed.get("source"),
+        seed.get("searchTerm") or seed.get("seriesId") or "",
         seed.get("startDate"),
         seed.get("endDate"),
         seed.get("correctEvent"),
     )
-    return seed
+
+
+def _format_releases(releases: list[dict]) -> str | None:
+    """Format releases as "id: name" for the prompt (first 40), memoized on the cached list object."""
+    global _releases_str_cache
+    cached = _releases_str_cache
+    if cached is not None and cached[0] is releases:
+        return cached[1]
+    text = ", ".join(
+        f'{r.get("id", r.get("release_id", ""))}: {r.get("name", "")}'
+        for r in releases[:40]
+    ) or None
+    _releases_str_cache = (releases, text)
+    return text
+
+
+def _seed_prompt(requested_source: str, user_preference: str | None) -> str:
+    """Build the batch seed prompt for requested_source (may fetch the cached FRED releases list)."""
+    from api.prompts import build_puzzle_seed_prompt
+
+    series_list = _NBER_SERIES_LIST_STR if requested_source == "nber" else _FRED_SERIES_LIST_STR
+    fred_releases_list = None
+    if requested_source == "fred":
+        try:
+            from api.fred import get_releases_cached
+            fred_releases_list = _format_releases(get_releases_cached())
+        except Exception:
+            fred_releases_list = None
+
+    return build_puzzle_seed_prompt(
+        requested_source=requested_source,
+        series_list=series_list,
+        examples_str=_FEW_SHOT_SEEDS_JSON,
+        user_preference=user_preference,
+        fred_releases_list=fred_releases_list,
+        count=SEED_BATCH_SIZE,
+    )
+
+
+def _chat_kwargs(model: str, prompt: str) -> dict:
+    """Arguments for the streamed batch-seed chat completion (shared by sync and async clients)."""
+    return {
+        "model": model,
+        "messages": [{"role": "user", "content": prompt}],
+        "temperature": 0.7,
+        "max_tokens": _SEED_MAX_TOKENS_PER_SEED * SEED_BATCH_SIZE,
+        "response_format": {"type": "json_object"},
+        "stream": True,
+    }
+
+
+def _request_seeds(
+    api_key: str,
+    requested_source: str,
+    user_preference: str | None,
+) -> tuple[dict, Iterator[dict] | None]:
+    """
+    One streamed LLM request for a batch of seeds (or a cache hit). Returns the first validated
+    seed as soon as it has streamed in (it is also added to the prompt cache), plus an iterator
+    over the rest of the batch for the seed queue (None on a cache hit). Raises on API errors
+    or if the reply holds no usable seed.
+    """
+    model = _model
+    prompt = _seed_prompt(requested_source, user_preference)
+    cache_key = _prompt_key(model, prompt)
+    cached = _cached_llm_seed(cache_key)
+    if cached is not None:
+        _log_seed("llm_cache", cached)
+        return cached, None
+
+    stream = get_client(api_key).chat.completions.create(**_chat_kwargs(model, prompt))
+    seeds = _iter_streamed_seeds(stream)
+    first = next(seeds)
+    _store_llm_seed(cache_key, first)
+    _log_seed("llm", first)
+    return first, seeds
+
+
+def _drain_streamed_seeds(qkey: tuple[str, str], seeds: Iterator[dict], lock: threading.Lock) -> None:
+    """Queue the remainder of a streamed batch, then release the refill lock held for qkey."""
+    try:
+        for seed in seeds:
+            _push_queued_seeds(qkey, [seed])
+    except Exception as e:
+        logger.warning("LLM seed stream ended early: %s", e)
+    finally:
+        lock.release()
+
+
+def _llm_seed_failed(e: Exception) -> dict:
+    """Map an LLM-path error to the fallback seed, or re-raise it for auth failures."""
+    import openai
+
+    # 429 quota: use fallback so game still works; log clearly so you can fix billing
+    if isinstance(e, openai.RateLimitError):
+        logger.warning(
+            "OpenAI returned 429 (insufficient quota). Using fallback seed. "
+            "To use LLM-generated seeds: add a payment method at https://platform.openai.com/account/billing"
+        )
+        return _random_seed_from_file()
+    # 401/403: re-raise so you know the key is invalid
+    if isinstance(e, (openai.AuthenticationError, openai.PermissionDeniedError)):
+        logger.warning("LLM seed generation failed (auth): %s", e)
+        raise e
+    logger.warning("LLM seed generation failed, using fallback: %s", e, exc_info=False)
+    return _random_seed_from_file()
+
+
+def _llm_api_key() -> str | None:
+    """OpenAI key if the LLM path is usable (openai installed, key set), else None."""
+    if not _OPENAI_AVAILABLE:
+        return None
+    _load_env()
+    if not _api_key:
+        logger.info("OPENAI_API_KEY missing or empty, using fallback seed")
+    return _api_key
 
 
 def generate_puzzle_seed(
@@ -147,121 +721,151 @@ def generate_puzzle_seed(
     Produce one puzzle seed: try LLM (OpenAI) first; on failure (quota, no key, etc.)
     fall back to a random seed from puzzle_seeds.json.
     If user_preference is set, the LLM is instructed to tailor the puzzle to that preference.
+    Each LLM request streams a batch of seeds: the first is returned as soon as it is complete,
+    the rest are queued in the background and served to later calls.
     Session deduplication (intervals and metrics) is handled by the caller (app).
     """
-
-    def fallback():
+    api_key = _llm_api_key()
+    if not api_key:
         return _random_seed_from_file()
 
     try:
-        from openai import OpenAI
-    except ImportError:
-        return fallback()
+        # NBER kept in codebase but excluded from prod for now (not reliable enough)
+        requested_source = _rng().choice(("fred", "google_trends"))
+        qkey = _queue_key(requested_source, user_preference)
+        seed = _pop_queued_seed(qkey)
+        if seed is not None:
+            _log_seed("llm_queue", seed)
+            return seed
+        lock = _refill_lock(qkey)
+        lock.acquire()
+        try:
+            # Another thread may have refilled the queue while this one waited
+            seed = _pop_queued_seed(qkey)
+            if seed is None:
+                seed, rest = _request_seeds(api_key, requested_source, user_preference)
+                if rest is not None:
+                    # The rest of the batch streams into the queue in the background; that
+                    # thread releases the lock once the stream is done
+                    threading.Thread(
+                        target=_drain_streamed_seeds,
+                        args=(qkey, rest, lock),
+                        name="seed-stream",
+                        daemon=True,
+                    ).start()
+                    lock = None
+        finally:
+            if lock is not None:
+                lock.release()
+        return seed
+    except Exception as e:
+        return _llm_seed_failed(e)
+
+
+async def _drain_streamed_seeds_async(
+    qkey: tuple[str, str], seeds: AsyncIterator[dict], refill: asyncio.Condition
+) -> None:
+    """Queue the remainder of an async streamed batch, waking waiters on each seed and at the end."""
+    try:
+        async for seed in seeds:
+            _push_queued_seeds(qkey, [seed])
+            async with refill:
+                refill.notify_all()
+    except Exception as e:
+        logger.warning("LLM seed stream ended early: %s", e)
+    finally:
+        await _end_refill(qkey, refill)
+
+
+async def _end_refill(qkey: tuple[str, str], refill: asyncio.Condition) -> None:
+    """Unregister qkey's in-flight refill and wake its waiters (they re-check the queue)."""
+    if _async_refills.get(qkey) is refill:
+        del _async_refills[qkey]
+    async with refill:
+        refill.notify_all()
 
-    raw_key = os.environ.get("OPENAI_API_KEY")
-    api_key = (raw_key or "").strip().strip('"').strip("'") if raw_key else None
-    if not api_key:
-        logger.info("OPENAI_API_KEY missing or empty, using fallback seed")
-        return fallback()
 
+async def _await_refill(qkey: tuple[str, str]) -> bool:
+    """
+    Wait for the in-flight async refill of qkey to queue a seed or end (at most OPENAI_TIMEOUT).
+    False if there is none or the wait timed out.
+    """
+    refill = _async_refills.get(qkey)
+    if refill is None:
+        return False
     try:
-        from api.prompts import build_puzzle_seed_prompt
+        async with refill:
+            await asyncio.wait_for(refill.wait(), OPENAI_TIMEOUT)
+    except TimeoutError:
+        return False
+    return True
+
+
+async def generate_puzzle_seed_async(
+    *,
+    user_preference: str | None = None,
+) -> dict:
+    """
+    Async form of generate_puzzle_seed for callers on an event loop: the OpenAI request goes
+    through AsyncOpenAI, so waiting on the model ties up no worker thread. Shares the seed
+    queue and prompt cache with the sync path; blocking file/cache work runs in a thread.
+    While a batch for the same source and preference is streaming, waits for its next seed
+    instead of sending another request.
+    """
+    api_key = _llm_api_key()
+    if not api_key:
+        return await asyncio.to_thread(_random_seed_from_file)
 
-        model = os.environ.get("OPENAI_MODEL", "gpt-4o-mini")
-        examples_str = json.dumps(FEW_SHOT_SEEDS, indent=2)
+    try:
         # NBER kept in codebase but excluded from prod for now (not reliable enough)
-        requested_source = random.choice(["fred", "google_trends"])
-        series_list = (
-            ", ".join(NBER_SERIES_EXAMPLES)
-            if requested_source == "nber"
-            else ", ".join(FRED_SERIES_EXAMPLES)
-        )
-        fred_releases_list = None
-        if requested_source == "fred":
-            try:
-                from api.fred import get_releases_cached
-                releases = get_releases_cached()
-                # Format as "id: name" for prompt (limit to 40 to keep prompt size reasonable)
-                fred_releases_list = ", ".join(
-                    f'{r.get("id", r.get("release_id", ""))}: {r.get("name", "")}'
-                    for r in releases[:40]
-                ) or None
-            except Exception:
-                fred_releases_list = None
-
-        prompt = build_puzzle_seed_prompt(
-            requested_source=requested_source,
-            series_list=series_list,
-            examples_str=examples_str,
-            user_preference=user_preference,
-            fred_releases_list=fred_releases_list,
-        )
+        requested_source = _rng().choice(("fred", "google_trends"))
+        qkey = _queue_key(requested_source, user_preference)
+        model = _model
+        while True:
+            seed = _pop_queued_seed(qkey)
+            if seed is not None:
+                _log_seed("llm_queue", seed)
+                return seed
+            if await _await_refill(qkey):
+                continue
+            prompt = await asyncio.to_thread(_seed_prompt, requested_source, user_preference)
+            cache_key = _prompt_key(model, prompt)
+            cached = await asyncio.to_thread(_cached_llm_seed, cache_key)
+            if cached is not None:
+                _log_seed("llm_cache", cached)
+                return cached
+            # Another call may have started a refill for qkey while this one built the prompt
+            if qkey not in _async_refills:
+                break
 
-        client = OpenAI(api_key=api_key)
-        resp = client.chat.completions.create(
-            model=model,
-            messages=[{"role": "user", "content": prompt}],
-            temperature=0.7,
-        )
-        text = (resp.choices[0].message.content or "").strip()
-
-        if "```" in text:
-            match = re.search(r"```(?:json)?\s*([\s\S]*?)```", text)
-            if match:
-                text = match.group(1).strip()
-
-        seed = json.loads(text)
-        source = (seed.get("source") or "fred").strip().lower()
-        if source == "google_trends":
-            required = ["searchTerm", "startDate", "endDate", "correctEvent", "acceptableAnswers", "explanation"]
-        elif source == "nber":
-            required = ["seriesId", "startDate", "endDate", "correctEvent", "acceptableAnswers", "explanation"]
-        else:
-            source = "fred"
-            seed["source"] = "fred"
-            required = ["startDate", "endDate", "correctEvent", "acceptableAnswers", "explanation"]
-            for k in required:
-                if k not in seed:
-                    raise ValueError(f"LLM seed missing key: {k}")
-            discovery = (seed.get("fredDiscovery") or "").strip().lower()
-            if discovery:
-                if discovery == "search" and not (seed.get("searchText") or "").strip():
-                    raise ValueError("LLM FRED seed fredDiscovery=search missing searchText")
-                if discovery == "release":
-                    rid = seed.get("releaseId") or seed.get("release_id")
-                    if rid is None or (isinstance(rid, (int, float)) and rid <= 0):
-                        raise ValueError("LLM FRED seed fredDiscovery=release missing or invalid releaseId")
-            elif not (seed.get("seriesId") or "").strip():
-                raise ValueError("LLM FRED seed missing seriesId (or fredDiscovery + searchText/releaseId)")
-        if source in ("google_trends", "nber"):
-            for k in required:
-                if k not in seed:
-                    raise ValueError(f"LLM seed missing key: {k}")
-        if not isinstance(seed["acceptableAnswers"], list):
-            seed["acceptableAnswers"] = [seed["acceptableAnswers"]]
-        _ensure_hints(seed)
-        seed["seed_source"] = "llm"
-        logger.info(
-            "seed_source=llm source=%s id=%s startDate=%s endDate=%s correctEvent=%s",
-            source,
-            seed.get("searchTerm") or seed.get("seriesId") or "",
-            seed.get("startDate"),
-            seed.get("endDate"),
-            seed.get("correctEvent"),
-        )
+        refill = _async_refills[qkey] = asyncio.Condition()
+        try:
+            stream = await get_async_client(api_key).chat.completions.create(**_chat_kwargs(model, prompt))
+            seeds = _aiter_streamed_seeds(stream)
+            seed = await anext(seeds)
+        except BaseException:
+            await _end_refill(qkey, refill)
+            raise
+        task = asyncio.create_task(_drain_streamed_seeds_async(qkey, seeds, refill))
+        _drain_tasks.add(task)
+        task.add_done_callback(_drain_tasks.discard)
+        await asyncio.to_thread(_store_llm_seed, cache_key, seed)
+        _log_seed("llm", seed)
         return seed
     except Exception as e:
-        err_str = str(e).lower()
-        # 429 quota: use fallback so game still works; log clearly so you can fix billing
-        if "429" in err_str or "quota" in err_str or "insufficient_quota" in err_str:
-            logger.warning(
-                "OpenAI returned 429 (insufficient quota). Using fallback seed. "
-                "To use LLM-generated seeds: add a payment method at https://platform.openai.com/account/billing"
-            )
-            return fallback()
-        # 401/403: re-raise so you know the key is invalid
-        if "401" in err_str or "403" in err_str:
-            logger.warning("LLM seed generation failed (auth): %s", e)
-            raise
-        logger.warning("LLM seed generation failed, using fallback: %s", e, exc_info=False)
-        return fallback()
+        return await asyncio.to_thread(_llm_seed_failed, e)
+
+
+async def generate_puzzle_seeds_async(
+    n: int,
+    *,
+    user_preference: str | None = None,
+) -> list[dict]:
+    """
+    Produce n seeds concurrently (e.g. to pre-generate a pool). The calls share in-flight batches
+    (see generate_puzzle_seed_async), so n seeds cost about one streamed LLM request per source,
+    and each call returns as soon as its own seed has streamed in rather than when the batch ends.
+    """
+    return list(
+        await asyncio.gather(*(generate_puzzle_seed_async(user_preference=user_preference) for _ in range(n)))
+    )
@@ -4,7 +4,7 @@ Route by source and delegate to source-specific adapters.
 """
 
 from puzzles_factory.base import BasePuzzleAdapter
-from puzzles_factory.router import build_puzzle, register_adapter
+from puzzles_factory.router import build_puzzle, fetch_observations, register_adapter
 
 # Register built-in adapters so build_puzzle(metadata) works for known sources
 from puzzles_factory.adapters.fred import FredAdapter
@@ -18,5 +18,6 @@ register_adapter(NberAdapter())
 __all__ = [
     "BasePuzzleAdapter",
     "build_puzzle",
+    "fetch_observations",
     "register_adapter",
 ]
@@ -6,18 +6,27 @@ Each adapter knows how to fetch observations and build the canonical puzzle stru
 import math
 from abc import ABC, abstractmethod
 
+from api.observations import Observation
+from puzzles_factory.viz_hints import get_viz_hints
+
+# Shape of puzzle["series"]: "columns" = {"dates": [...], "values": [...]} (was a list of {date, value})
+SERIES_FORMAT = "columns"
+
+# Common missing-value spellings (FRED ".", NBER "NA"); other non-numeric values fall through to float() -> NaN
+_MISSING_VALUES = frozenset((".", "NA", "na", "", None))
+
 
 class BasePuzzleAdapter(ABC):
-    """Adapter for one API source: fetch observations and build puzzle JSON."""
+    """
+    Adapter for one API source: fetch observations and build puzzle JSON.
+    Subclasses set source_id and implement fetch_observations; build_puzzle is shared.
+    """
 
-    @property
-    @abstractmethod
-    def source_id(self) -> str:
-        """Source identifier (e.g. 'fred', 'google_trends')."""
-        ...
+    # Source identifier (e.g. 'fred', 'google_trends'); a plain class attribute, not a property
+    source_id: str
 
     @abstractmethod
-    def fetch_observations(self, data: dict) -> list[dict]:
+    def fetch_observations(self, data: dict) -> list[Observation]:
         """
         Fetch time-series observations for this source using source-specific data.
 
@@ -25,39 +34,54 @@ class BasePuzzleAdapter(ABC):
             data: Source-specific payload (e.g. {"seriesId", "startDate", "endDate"} for FRED).
 
         Returns:
-            List of {"date": "YYYY-MM-DD", "value": "..."}.
+            List of Observation(date="YYYY-MM-DD", value="...").
         """
         ...
 
-    @abstractmethod
-    def build_puzzle(self, metadata: dict, observations: list[dict]) -> dict:
+    def build_puzzle(self, metadata: dict, observations: list[Observation]) -> dict:
         """
         Build the canonical puzzle JSON struct from metadata and observations.
 
         Args:
             metadata: Puzzle definition (id, source, title, correctEvent, acceptableAnswers, explanation, data).
-            observations: List of {"date", "value"} from fetch_observations.
+            observations: List of Observation(date, value) from fetch_observations.
 
         Returns:
-            Full puzzle dict: metadata fields + optional "series" (normalized observations).
+            Full puzzle dict: metadata fields + "series" ({"dates", "values"} columns) + viz hints.
         """
-        ...
+        viz = get_viz_hints(self.source_id, metadata)
+        return {
+            "id": metadata["id"],
+            "source": metadata["source"],
+            "title": metadata["title"],
+            "correctEvent": metadata["correctEvent"],
+            "acceptableAnswers": metadata["acceptableAnswers"],
+            "explanation": metadata["explanation"],
+            "data": metadata["data"],
+            "series": self._normalize_series(observations),
+            "seriesFormat": SERIES_FORMAT,
+            "chartType": viz["chartType"],
+            "yLabel": viz["yLabel"],
+            **({"yLimits": viz["yLimits"]} if viz.get("yLimits") is not None else {}),
+        }
 
     @staticmethod
-    def _normalize_series(observations: list[dict]) -> list[dict]:
+    def _normalize_series(observations: list[Observation]) -> dict[str, list]:
         """
-        Normalize observations: parse numeric values; use NaN for missing (".", "NA")
-        so the full date range is preserved (e.g. NBER with gaps).
+        Normalize observations into columns {"dates": [...], "values": [...]}: parse numeric
+        values; use NaN for missing (".", "NA") so the full date range is preserved (e.g. NBER with gaps).
         """
-        out = []
+        dates = [ob.date for ob in observations]
+        values = []
+        append = values.append
         for ob in observations:
-            val = ob.get("value", ".")
-            if val == "." or val is None or (isinstance(val, str) and val.strip().upper() == "NA"):
-                out.append({"date": ob["date"], "value": math.nan})
+            val = ob.value
+            if val in _MISSING_VALUES:
+                append(math.nan)
                 continue
             try:
                 num = float(val)
             except (TypeError, ValueError):
                 num = math.nan
-            out.append({"date": ob["date"], "value": num})
-        return out
+            append(num)
+        return {"dates": dates, "values": values}
@@ -2,9 +2,11 @@
 Route puzzle build requests to the correct source adapter and return puzzle JSON.
 """
 
+import sys
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
+    from api.observations import Observation
     from puzzles_factory.base import BasePuzzleAdapter
 
 # Registry: source_id -> adapter instance
@@ -13,7 +15,8 @@ _registry: dict[str, "BasePuzzleAdapter"] = {}
 
 def register_adapter(adapter: "BasePuzzleAdapter") -> None:
     """Register an adapter for its source_id. Re-registering overwrites."""
-    _registry[adapter.source_id] = adapter
+    # Interned so keys are shared with other "fred"/"nber"/... literals (identity hit on lookup)
+    _registry[sys.intern(adapter.source_id)] = adapter
 
 
 def _get_adapter(source: str) -> "BasePuzzleAdapter":
@@ -24,7 +27,27 @@ def _get_adapter(source: str) -> "BasePuzzleAdapter":
     return adapter
 
 
-def build_puzzle(metadata: dict) -> dict:
+def _resolve(metadata: dict) -> tuple["BasePuzzleAdapter", dict]:
+    """(adapter, data) for puzzle metadata; raise if source or data is missing or unknown."""
+    source = metadata.get("source")
+    if not source:
+        raise ValueError("Puzzle metadata must include 'source'")
+    data = metadata.get("data")
+    if not data:
+        raise ValueError("Puzzle metadata must include 'data'")
+    return _get_adapter(source), data
+
+
+def fetch_observations(metadata: dict) -> list["Observation"]:
+    """
+    Fetch the observations for puzzle metadata through its source adapter (cache when applicable).
+    Only "source" and "data" are read, so this can run before the rest of the metadata is final.
+    """
+    adapter, data = _resolve(metadata)
+    return adapter.fetch_observations(data)
+
+
+def build_puzzle(metadata: dict, observations: list["Observation"] | None = None) -> dict:
     """
     Build a full puzzle struct from puzzle metadata (e.g. one entry from puzzles.json).
 
@@ -34,17 +57,12 @@ def build_puzzle(metadata: dict) -> dict:
     Args:
         metadata: Must contain "source" and "data" (source-specific). Typically also
                   id, title, correctEvent, acceptableAnswers, explanation.
+        observations: Already fetched with fetch_observations(metadata); fetched here if None.
 
     Returns:
-        Puzzle dict with metadata fields and "series" (list of {date, value}) for plotting.
+        Puzzle dict with metadata fields and "series" ({"dates": [...], "values": [...]}) for plotting.
     """
-    source = metadata.get("source")
-    if not source:
-        raise ValueError("Puzzle metadata must include 'source'")
-    data = metadata.get("data")
-    if not data:
-        raise ValueError("Puzzle metadata must include 'data'")
-
-    adapter = _get_adapter(source)
-    observations = adapter.fetch_observations(data)
+    adapter, data = _resolve(metadata)
+    if observations is None:
+        observations = adapter.fetch_observations(data)
     return adapter.build_puzzle(metadata, observations)
@@ -4,43 +4,43 @@ Adapters merge these into the built puzzle when metadata does not override.
 """
 
 
-def _default_viz_hints(source: str, metadata: dict) -> dict:
-    """
-    Return default chartType, yLabel, and optional yLimits for a source.
-    Internal: used by adapters when building the puzzle.
-    """
-    if source == "fred":
-        return {
-            "chartType": "line",
-            "yLabel": metadata.get("title") or "Value",
-        }
-    if source == "google_trends":
-        return {
-            "chartType": "line",
-            "yLabel": "Search interest (0–100)",
-            "yLimits": (0, 100),
-        }
-    if source == "nber":
-        return {
-            "chartType": "line",
-            "yLabel": metadata.get("title") or "Value",
-        }
+def _title_viz_hints(metadata: dict) -> dict:
+    """FRED, NBER, and unknown sources: line chart labelled with the series title."""
+    chart_type = metadata.get("chartType")
+    y_label = metadata.get("yLabel")
+    y_limits = metadata.get("yLimits")
+    hints = {
+        "chartType": "line" if chart_type is None else chart_type,
+        "yLabel": (metadata.get("title") or "Value") if y_label is None else y_label,
+    }
+    if y_limits is not None:
+        hints["yLimits"] = y_limits
+    return hints
+
+
+def _google_trends_viz_hints(metadata: dict) -> dict:
+    """Google Trends: search interest is always on a 0-100 scale."""
+    chart_type = metadata.get("chartType")
+    y_label = metadata.get("yLabel")
+    y_limits = metadata.get("yLimits")
     return {
-        "chartType": "line",
-        "yLabel": metadata.get("title") or "Value",
+        "chartType": "line" if chart_type is None else chart_type,
+        "yLabel": "Search interest (0–100)" if y_label is None else y_label,
+        "yLimits": (0, 100) if y_limits is None else y_limits,
     }
 
 
+# source -> hints builder; each builds the final dict in one step (defaults + metadata overrides)
+_HINTS_BY_SOURCE = {
+    "fred": _title_viz_hints,
+    "google_trends": _google_trends_viz_hints,
+    "nber": _title_viz_hints,
+}
+
+
 def get_viz_hints(source: str, metadata: dict) -> dict:
     """
     Return viz hints for the puzzle: metadata overrides (chartType, yLabel, yLimits) take
     precedence over source defaults.
     """
-    hints = _default_viz_hints(source, metadata)
-    if metadata.get("chartType") is not None:
-        hints["chartType"] = metadata["chartType"]
-    if metadata.get("yLabel") is not None:
-        hints["yLabel"] = metadata["yLabel"]
-    if metadata.get("yLimits") is not None:
-        hints["yLimits"] = metadata["yLimits"]
-    return hints
+    return _HINTS_BY_SOURCE.get(source, _title_viz_hints)(metadata)
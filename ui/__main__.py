@@ -0,0 +1,21 @@
+"""
+Run the web app: python -m ui (python ui/app.py delegates here).
+Kept apart from ui.app so spawned processes (render pool, uvicorn workers) do not re-import the
+app as their __main__: multiprocessing skips re-running a package's __main__ module.
+"""
+
+import os
+
+import uvicorn
+
+if __name__ == "__main__":
+    # uvloop event loop + httptools parser (both from uvicorn[standard]). Game, seed, and session state
+    # live in this process, so more than one worker (WEB_CONCURRENCY) needs sticky routing per player.
+    uvicorn.run(
+        "ui.app:app",
+        host=os.environ.get("HOST", "0.0.0.0"),
+        port=int(os.environ.get("PORT", "8000")),
+        loop="uvloop",
+        http="httptools",
+        workers=int(os.environ.get("WEB_CONCURRENCY", "1")),
+    )
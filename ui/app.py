@@ -1,12 +1,23 @@
 """
 Minimal web UI: one-time gameplay. GET /api/game/new generates one puzzle (LLM + FRED/Google Trends),
-serves chart; POST /api/game/guess checks the guess against the current game (4 attempts, hints).
+serves chart; POST /api/game/guess checks the guess against the game for its gameToken (4 attempts, hints).
 """
 
-import base64
+import asyncio
+import bisect
+import functools
+import hashlib
 import logging
+import multiprocessing
+import os
+import secrets
 import sys
+import time
+from collections import OrderedDict, deque
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import asynccontextmanager
 from pathlib import Path
+from urllib.parse import quote
 
 PROJECT_ROOT = Path(__file__).resolve().parent.parent
 if str(PROJECT_ROOT) not in sys.path:
@@ -15,11 +26,39 @@ if str(PROJECT_ROOT) not in sys.path:
 from dotenv import load_dotenv
 load_dotenv(PROJECT_ROOT / ".env")
 
-from fastapi import FastAPI, HTTPException
-from fastapi.responses import FileResponse
+try:  # SIMD base64 (several times faster on chart-sized payloads); same output as the stdlib
+    from pybase64 import b64encode as _b64encode
+except ImportError:
+    import binascii
+
+    # The C encoder base64.standard_b64encode wraps, minus the wrapper's per-call overhead
+    _b64encode = functools.partial(binascii.b2a_base64, newline=False)
+
+from fastapi import Depends, FastAPI, HTTPException, Request
+from fastapi.responses import FileResponse, JSONResponse, Response
 from fastapi.staticfiles import StaticFiles
 from pydantic import BaseModel
 
+try:  # Rust encoder for JSON responses (fast on the large imageBase64 string); stdlib JSONResponse otherwise
+    import orjson
+
+    class _JSONResponse(JSONResponse):
+        def render(self, content) -> bytes:
+            return orjson.dumps(content)
+
+except ImportError:
+    _JSONResponse = JSONResponse
+
+from api import cache_disk, fred, nber
+from api.fred import get_release_series, get_releases_cached, get_series, search_series
+from api.guess_evaluator import evaluate_guess_with_llm_async
+from api.nber import get_series_info
+from api.openai_client import aclose_clients
+from api.seed_generator import generate_puzzle_seed_async, generate_puzzle_seeds_async
+from puzzles_factory import build_puzzle, fetch_observations
+from ui import render_worker
+from visualization.plotter import CHART_FORMATS
+
 STATIC_DIR = Path(__file__).resolve().parent / "static"
 
 logger = logging.getLogger(__name__)
@@ -34,9 +73,14 @@ def _slug(series_id: str, start: str, end: str, index: int) -> str:
     return f"fred-{series_id}-{start}-{end}-{index}"
 
 
-def _slug_trends(keyword: str, start: str, end: str, index: int) -> str:
-    """Unique id for a Google Trends puzzle (keyword may contain spaces)."""
-    safe = (keyword or "").replace(" ", "_")[:30]
+def _slug_trends(keyword: str, start: str, end: str, index: int, geo: str = "") -> str:
+    """
+    Unique id for a Google Trends puzzle (keyword may contain spaces). The full keyword and the geo
+    (when set) are kept: the id keys the rendered-chart cache, so distinct charts need distinct ids.
+    """
+    safe = (keyword or "").replace(" ", "_")
+    if geo:
+        return f"google_trends-{safe}-{geo}-{start}-{end}-{index}"
     return f"google_trends-{safe}-{start}-{end}-{index}"
 
 
@@ -50,61 +94,272 @@ def _normalize_guess(guess: str) -> str:
     return guess.strip().lower()
 
 
-def _check_guess(guess: str, acceptable: list[str]) -> bool:
-    g = _normalize_guess(guess)
-    return g in [a.strip().lower() for a in acceptable]
+def _acceptable_set(seed: dict) -> frozenset[str]:
+    """Normalized acceptableAnswers plus correctEvent, built once per game for O(1) guess checks."""
+    answers = list(seed.get("acceptableAnswers") or []) + [seed.get("correctEvent") or ""]
+    return frozenset(_normalize_guess(a) for a in answers if a)
 
 
-# Single current game in memory: set when /api/game/new succeeds; used by /api/game/guess
-_current_game: dict | None = None
+def _check_guess(guess: str, acceptable: frozenset[str]) -> bool:
+    return _normalize_guess(guess) in acceptable
 
-# Session state: avoid repeating time intervals or y-axis metrics per server lifetime
-_session_displayed_intervals: list[tuple[str, str]] = []
-_session_displayed_metrics: set[str] = set()
 
-# Seed produced by GET /api/game/seed; consumed by POST /api/game/build for stage-based loading UI
-_pending_seed: dict | None = None
+class _TTLStore:
+    """
+    Per-player state by key: each entry expires ttl seconds after it is stored, and past maxsize the
+    oldest entries are dropped. Touched only on the event loop, so no locking.
+    """
 
+    def __init__(self, maxsize: int, ttl: float) -> None:
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: "OrderedDict[str, tuple[float, object]]" = OrderedDict()
+
+    def set(self, key: str, value: object) -> None:
+        self._entries.pop(key, None)
+        self._entries[key] = (time.monotonic() + self.ttl, value)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def get(self, key: str) -> object | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if entry[0] <= time.monotonic():
+            del self._entries[key]
+            return None
+        return entry[1]
+
+    def pop(self, key: str) -> object | None:
+        value = self.get(key)
+        self._entries.pop(key, None)
+        return value
+
+
+# Active games by gameToken (returned by /api/game/build, sent back with each guess), so concurrent
+# players don't overwrite each other. A game expires GAME_TTL seconds after it was built.
+GAME_TTL = 3600.0
+_games = _TTLStore(maxsize=10000, ttl=GAME_TTL)
+# Each session's most recent gameToken, for clients that predate gameToken (session cookie -> token)
+_latest_games = _TTLStore(maxsize=10000, ttl=GAME_TTL)
+
+# Session state: avoid repeating time intervals or y-axis metrics for a player. Each history remembers
+# the player's last CAUSAL_GUESSR_SESSION_CAP puzzles (oldest forgotten first); histories are kept per
+# session cookie and dropped SESSION_TTL seconds after the player's last game.
+SESSION_CAP = max(1, int(os.environ.get("CAUSAL_GUESSR_SESSION_CAP", "500")))
+SESSION_TTL = 86400.0
+
+# Seed produced by GET /api/game/seed and consumed by POST /api/game/build (stage-based loading UI), per
+# player session cookie: (seed, built) where built is the prewarmed (seed, metadata, title, png_bytes) or None
+SESSION_COOKIE = "causal_guessr_session"
+_pending = _TTLStore(maxsize=1024, ttl=900.0)
+
+
+def _session_id(request: Request, response: Response) -> str:
+    """The player's session id from its cookie, issuing a new cookie on first contact."""
+    sid = request.cookies.get(SESSION_COOKIE)
+    if not sid:
+        sid = secrets.token_urlsafe(16)
+        response.set_cookie(SESSION_COOKIE, sid, httponly=True, samesite="lax")
+    return sid
+
+# Next puzzles built in the background while players are guessing, by preference: each deque holds
+# _build_from_seed results (newest _PREWARM_PER_PREF kept), consumed by the next seed/new request
+# with that preference. At most _PREWARM_MAX_PREFS preferences (least recently used dropped) and
+# one prewarm task per preference at a time.
+_PREWARM_PER_PREF = 2
+_PREWARM_MAX_PREFS = 64
+_prewarmed: "OrderedDict[str | None, deque[tuple]]" = OrderedDict()
+_prewarm_tasks: dict[str | None, asyncio.Task] = {}
+
+
+# Rendered charts (PNG bytes) by puzzle id, LRU-bounded: a puzzle id fixes the source, series
+# (search term and geo for Trends) and date range, so a repeat puzzle - a retry that lands on the
+# same seed, or a series shown again after the session history rolls over - skips the data fetch
+# and matplotlib. Served by GET /api/game/image/{pid}.
+# Touched only on the event loop.
+_IMAGE_CACHE_MAX = 256
+# Entries are (image bytes, ETag) so the image endpoint can answer revalidations with 304.
+_image_cache: "OrderedDict[str, tuple[bytes, str]]" = OrderedDict()
+
+
+def _cached_image(pid: str) -> tuple[bytes, str] | None:
+    """(image bytes, ETag) previously rendered for pid, or None."""
+    entry = _image_cache.get(pid)
+    if entry is not None:
+        _image_cache.move_to_end(pid)
+    return entry
+
+
+def _store_image(pid: str, png_bytes: bytes) -> None:
+    """Remember the rendered chart for pid, evicting the least recently used beyond _IMAGE_CACHE_MAX."""
+    _image_cache[pid] = (png_bytes, f'"{hashlib.blake2b(png_bytes, digest_size=16).hexdigest()}"')
+    _image_cache.move_to_end(pid)
+    while len(_image_cache) > _IMAGE_CACHE_MAX:
+        _image_cache.popitem(last=False)
+
+
+# Chart rendering is CPU-bound and matplotlib is not thread-safe, so charts are drawn in worker
+# processes (started in lifespan; they run ui.render_worker, which imports only the plotter).
+# Per web worker, so the default stays small; RENDER_PROCESSES=0 renders in a thread instead.
+RENDER_PROCESSES = int(os.environ.get("RENDER_PROCESSES", str(min(2, os.cpu_count() or 1))))
+_render_pool: ProcessPoolExecutor | None = None
+
+# Chart image format (visualization.plotter.CHART_FORMATS key). "webp" (lossless) is ~40% smaller;
+# "png" stays the default because inlineImage clients build image/png data URIs from imageBase64.
+CHART_FORMAT = os.environ.get("CHART_FORMAT", "png")
+CHART_MEDIA_TYPE = CHART_FORMATS[CHART_FORMAT][2]
+_plot_chart = functools.partial(render_worker.render_chart, fmt=CHART_FORMAT)
+
+
+async def _render_chart(puzzle: dict) -> bytes:
+    """Chart image bytes for a built puzzle, rendered in the process pool (or a thread when there is none)."""
+    if _render_pool is None:
+        return await asyncio.to_thread(_plot_chart, puzzle)
+    return await asyncio.get_running_loop().run_in_executor(_render_pool, _plot_chart, puzzle)
+
+
+def _store_game(game: dict) -> str:
+    """Register a new game and return its gameToken. Each game carries its own lock for guesses."""
+    token = secrets.token_urlsafe(16)
+    game["lock"] = asyncio.Lock()
+    _games.set(token, game)
+    _latest_games.set(game["session"], token)
+    return token
+
+
+def _get_game(token: str | None, sid: str) -> dict | None:
+    """
+    Game for token (session sid's latest game when token is None), or None if unknown or expired.
+    """
+    return _games.get(token or _latest_games.get(sid) or "")
 
-def _intervals_overlap(start: str, end: str, intervals: list[tuple[str, str]]) -> bool:
-    """True if (start, end) overlaps any (a_start, a_end) in intervals. YYYY-MM-DD string comparison."""
-    for a_start, a_end in intervals:
-        if start <= a_end and a_start <= end:
-            return True
-    return False
 
+class _SessionHistory:
+    """
+    Date ranges and metrics one player has been shown. Intervals are kept sorted by start;
+    max_ends[i] is the latest end among the first i + 1. interval_order holds the same intervals
+    oldest first, for eviction.
+    """
 
-def _metric_key(seed: dict) -> str:
-    """Canonical key for the y-axis metric: fred:seriesId, google_trends:searchTerm (normalized), nber:seriesId."""
-    source = (seed.get("source") or "fred").strip().lower()
+    def __init__(self) -> None:
+        self.intervals: list[tuple[str, str]] = []
+        self.max_ends: list[str] = []
+        self.interval_order: deque[tuple[str, str]] = deque()
+        self.metrics: "OrderedDict[str, None]" = OrderedDict()
+
+    def overlaps(self, start: str, end: str) -> bool:
+        """
+        True if (start, end) overlaps any displayed (a_start, a_end). YYYY-MM-DD string comparison.
+        O(log n): binary-search the intervals with a_start <= end, then check the latest end among them.
+        """
+        i = bisect.bisect_right(self.intervals, end, key=lambda interval: interval[0])
+        return i > 0 and self.max_ends[i - 1] >= start
+
+    def fits(self, seed: dict) -> bool:
+        """True if seed's date range and metric have not been shown to this player."""
+        return not (self.overlaps(seed["startDate"], seed["endDate"]) or _metric_key(seed) in self.metrics)
+
+    def add(self, seed: dict) -> None:
+        """Record seed's date range and metric as shown, evicting the oldest beyond SESSION_CAP."""
+        self._add_interval(seed["startDate"], seed["endDate"])
+        key = _metric_key(seed)
+        self.metrics[key] = None
+        self.metrics.move_to_end(key)
+        while len(self.metrics) > SESSION_CAP:
+            self.metrics.popitem(last=False)
+
+    def _add_interval(self, start: str, end: str) -> None:
+        """Insert (start, end) in start order, evicting the oldest interval beyond SESSION_CAP."""
+        i = bisect.bisect_right(self.intervals, (start, end))
+        self.intervals.insert(i, (start, end))
+        self.interval_order.append((start, end))
+        if len(self.interval_order) > SESSION_CAP:
+            j = bisect.bisect_left(self.intervals, self.interval_order.popleft())
+            del self.intervals[j]
+            i = min(i, j)
+        # Refresh the running max of ends from the first changed position on
+        running = self.max_ends[i - 1] if i else ""
+        del self.max_ends[i:]
+        for _, a_end in self.intervals[i:]:
+            running = max(running, a_end)
+            self.max_ends.append(running)
+
+
+# _SessionHistory by session cookie
+_histories = _TTLStore(maxsize=10000, ttl=SESSION_TTL)
+
+
+def _fits_session(seed: dict, sid: str) -> bool:
+    """True if seed's date range and metric have not been shown in session sid."""
+    history = _histories.get(sid)
+    return history is None or history.fits(seed)
+
+
+def _record_displayed(seed: dict, sid: str) -> None:
+    """Add seed to session sid's history (created on first game) and restart its expiry."""
+    history = _histories.get(sid) or _SessionHistory()
+    history.add(seed)
+    _histories.set(sid, history)
+
+
+@functools.lru_cache(maxsize=4096)
+def _metric_key_for(source: str, series_id: str, term: str) -> str:
+    """_metric_key for raw seed fields; memoized since the same seeds are checked on every retry."""
+    source = source.strip().lower() or "fred"
     if source == "google_trends":
-        term = (seed.get("searchTerm") or "").strip().lower()
-        return f"google_trends:{term}"
+        return f"google_trends:{term.strip().lower()}"
     if source == "nber":
-        return f"nber:{seed.get('seriesId') or ''}"
-    return f"fred:{seed.get('seriesId') or ''}"
+        return f"nber:{series_id}"
+    return f"fred:{series_id}"
 
 
-app = FastAPI(title="Causal Guessr")
+def _metric_key(seed: dict) -> str:
+    """Canonical key for the y-axis metric: fred:seriesId, google_trends:searchTerm (normalized), nber:seriesId."""
+    return _metric_key_for(seed.get("source") or "", seed.get("seriesId") or "", seed.get("searchTerm") or "")
 
 
-@app.on_event("startup")
-def startup_cache_fred_releases():
+def _cache_fred_releases() -> None:
     """Cache FRED releases at startup for release-based seed discovery."""
     try:
-        from api.fred import get_releases_cached
         get_releases_cached()
     except Exception as e:
         logger.warning("Startup FRED releases cache failed (release discovery may be empty): %s", e)
 
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    One set of outbound clients for the app's lifetime: the shared FRED/NBER sessions and OpenAI
+    clients are warmed at startup and their connection pools (plus the disk cache) closed at shutdown.
+    The chart render pool lives for the same span.
+    """
+    global _render_pool
+    if RENDER_PROCESSES > 0:
+        # spawn: forking a process that already runs the event loop and client threads is unsafe
+        _render_pool = ProcessPoolExecutor(RENDER_PROCESSES, mp_context=multiprocessing.get_context("spawn"))
+    await asyncio.to_thread(_cache_fred_releases)
+    yield
+    for task in list(_prewarm_tasks.values()):
+        task.cancel()
+    if _render_pool is not None:
+        _render_pool.shutdown(cancel_futures=True)
+        _render_pool = None
+    await aclose_clients()
+    fred.close()
+    nber.close()
+    cache_disk.close()
+
+
+app = FastAPI(title="Causal Guessr", lifespan=lifespan, default_response_class=_JSONResponse)
+
+
 @app.get("/api/debug/openai")
 def debug_openai_key():
     """
     Verify OPENAI_API_KEY is loaded. Returns configured=true/false and a safe key prefix.
     Do not use in production if you want to hide whether a key is set.
     """
-    import os
     raw = os.environ.get("OPENAI_API_KEY")
     key = (raw or "").strip().strip('"').strip("'") if raw else None
     return {
@@ -115,6 +370,7 @@ def debug_openai_key():
 
 
 _MAX_SEED_RETRIES = 5  # try up to this many seeds when FRED/Trends fails
+_RACE_WIDTH = 2  # candidate builds in flight at once (see _race_builds)
 
 
 def _resolve_fred_discovery(seed: dict) -> None:
@@ -134,7 +390,6 @@ def _resolve_fred_discovery(seed: dict) -> None:
         search_text = (seed.get("searchText") or "").strip()
         if not search_text:
             raise ValueError("FRED discovery=search missing searchText")
-        from api.fred import search_series
         series_list = search_series(search_text, limit=50)
     elif discovery == "release":
         try:
@@ -143,7 +398,6 @@ def _resolve_fred_discovery(seed: dict) -> None:
             raise ValueError("FRED discovery=release missing or invalid releaseId")
         if release_id <= 0:
             raise ValueError("FRED discovery=release missing releaseId")
-        from api.fred import get_release_series
         series_list = get_release_series(release_id, limit=500)
     else:
         return
@@ -164,35 +418,29 @@ def _resolve_fred_discovery(seed: dict) -> None:
         raise ValueError("FRED series object missing id")
 
 
-def _get_valid_seed(user_pref: str | None) -> dict:
+async def _get_valid_seed(user_pref: str | None, sid: str) -> dict:
     """Return a seed that passes session overlap and metric checks. Raises HTTPException after max retries."""
-    from api.seed_generator import generate_puzzle_seed
-
     for attempt in range(1, _MAX_SEED_RETRIES + 1):
         try:
-            seed = generate_puzzle_seed(user_preference=user_pref)
+            seed = await generate_puzzle_seed_async(user_preference=user_pref)
         except Exception as e:
             raise HTTPException(
                 status_code=503,
                 detail=f"Could not generate puzzle seed: {e!s}",
             ) from e
-        start = seed["startDate"]
-        end = seed["endDate"]
-        if _intervals_overlap(start, end, _session_displayed_intervals):
-            continue
-        if _metric_key(seed) in _session_displayed_metrics:
-            continue
-        return seed
+        if _fits_session(seed, sid):
+            return seed
     raise HTTPException(
         status_code=503,
         detail="Could not generate a puzzle seed that passes session diversity checks after max retries.",
     )
 
 
-def _metadata_and_title_from_seed(seed: dict) -> tuple[dict, str, str]:
-    """Build puzzle metadata and title from a seed. Returns (metadata, title, log_id). Raises on invalid seed."""
-    from api.fred import get_series
-
+def _metadata_from_seed(seed: dict) -> tuple[dict, str]:
+    """
+    Build puzzle metadata from a seed without any network call (FRED/NBER titles are placeholders
+    until _series_title). Returns (metadata, log_id). Raises on invalid seed.
+    """
     source = seed.get("source", "fred")
     start = seed["startDate"]
     end = seed["endDate"]
@@ -201,12 +449,12 @@ def _metadata_and_title_from_seed(seed: dict) -> tuple[dict, str, str]:
         keyword = seed.get("searchTerm") or ""
         if not keyword:
             raise ValueError("google_trends seed missing searchTerm")
-        pid = _slug_trends(keyword, start, end, 0)
-        title = f"Search: {keyword}"
+        geo = seed.get("geo") or ""
+        pid = _slug_trends(keyword, start, end, 0, geo)
         metadata = {
             "id": pid,
             "source": "google_trends",
-            "title": title,
+            "title": f"Search: {keyword}",
             "correctEvent": seed["correctEvent"],
             "acceptableAnswers": seed.get("acceptableAnswers") or [],
             "explanation": seed.get("explanation") or "",
@@ -214,256 +462,390 @@ def _metadata_and_title_from_seed(seed: dict) -> tuple[dict, str, str]:
                 "searchTerm": keyword,
                 "startDate": start,
                 "endDate": end,
-                "geo": seed.get("geo") or "",
+                "geo": geo,
             },
         }
-        return metadata, title, keyword
+        return metadata, keyword
     if source == "nber":
         series_id = seed.get("seriesId") or ""
         if not series_id:
             raise ValueError("nber seed missing seriesId")
         pid = _slug_nber(series_id, start, end, 0)
-        try:
-            from api.nber import get_series_info
-            info = get_series_info(series_id)
-            title = (info.get("description") or "").strip() or f"NBER: {series_id}"
-        except Exception:
-            title = f"NBER: {series_id}"
-        metadata = {
-            "id": pid,
-            "source": "nber",
-            "title": title,
-            "correctEvent": seed["correctEvent"],
-            "acceptableAnswers": seed.get("acceptableAnswers") or [],
-            "explanation": seed.get("explanation") or "",
-            "data": {"seriesId": series_id, "startDate": start, "endDate": end},
-        }
-        return metadata, title, series_id
-    # fred
-    series_id = seed.get("seriesId") or ""
-    if not series_id:
-        raise ValueError("fred seed missing seriesId")
-    pid = _slug(series_id, start, end, 0)
-    title = series_id
-    try:
-        info = get_series(series_id)
-        title = info.get("title", series_id)
-    except Exception:
-        pass
+        title = f"NBER: {series_id}"
+    else:  # fred
+        series_id = seed.get("seriesId") or ""
+        if not series_id:
+            raise ValueError("fred seed missing seriesId")
+        source = "fred"
+        pid = _slug(series_id, start, end, 0)
+        title = series_id
     metadata = {
         "id": pid,
-        "source": "fred",
+        "source": source,
         "title": title,
         "correctEvent": seed["correctEvent"],
         "acceptableAnswers": seed.get("acceptableAnswers") or [],
         "explanation": seed.get("explanation") or "",
         "data": {"seriesId": series_id, "startDate": start, "endDate": end},
     }
-    return metadata, title, series_id
+    return metadata, series_id
+
+
+def _series_title(metadata: dict) -> str:
+    """Chart title for the puzzle: the FRED/NBER series name (blocking lookup), else metadata's title."""
+    source = metadata["source"]
+    series_id = metadata["data"].get("seriesId")
+    try:
+        if source == "fred":
+            return get_series(series_id).get("title", series_id)
+        if source == "nber":
+            return (get_series_info(series_id).get("description") or "").strip() or metadata["title"]
+    except Exception:
+        pass
+    return metadata["title"]
 
 
 @app.get("/api/game/seed")
-def get_seed(preference: str | None = None):
+async def get_seed(preference: str | None = None, sid: str = Depends(_session_id)):
     """
-    Generate a puzzle seed that passes session diversity checks and store it for POST /api/game/build.
+    Generate a puzzle seed that passes session diversity checks and store it for POST /api/game/build
+    under the player's session cookie (set here if missing).
     Frontend can show "Generating puzzle seed..." during this call.
     Returns { "status": "ok" }. On failure returns 503.
     """
-    global _pending_seed
-    try:
-        _pending_seed = _get_valid_seed((preference or "").strip() or None)
-    except HTTPException:
-        raise
+    user_pref = (preference or "").strip() or None
+    built = _take_prewarmed(user_pref, sid)
+    if built is not None:
+        _pending.set(sid, (built[0], built))
+        return {"status": "ok"}
+    _pending.set(sid, (await _get_valid_seed(user_pref, sid), None))
     return {"status": "ok"}
 
 
 class BuildBody(BaseModel):
     preference: str | None = None
+    # Also return the PNG inline as imageBase64 (older clients); otherwise only imageUrl is sent
+    inlineImage: bool = False
 
 
-@app.post("/api/game/build")
-def build_game(body: BuildBody | None = None):
+async def _candidate_seeds(user_pref: str | None, n: int, sid: str) -> list[dict]:
     """
-    Build the puzzle from the seed stored by GET /api/game/seed (fetch data, render chart), set current game.
-    Frontend can show "Fetching economic data..." during this call.
-    Call GET /api/game/seed first. Optional body.preference used when retrying with a new seed on fetch failure.
-    Returns { id, title, imageBase64, seed_source, attempts_left }. On failure returns 503.
+    Up to n seeds that pass session sid's checks, generated together (batched LLM round-trips).
+    Falls back to _get_valid_seed's serial retries if the whole batch is filtered out.
     """
-    global _current_game, _pending_seed, _session_displayed_intervals, _session_displayed_metrics
+    try:
+        seeds = await generate_puzzle_seeds_async(n, user_preference=user_pref)
+    except Exception as e:
+        raise HTTPException(
+            status_code=503,
+            detail=f"Could not generate puzzle seed: {e!s}",
+        ) from e
+    seeds = [seed for seed in seeds if _fits_session(seed, sid)]
+    return seeds or [await _get_valid_seed(user_pref, sid)]
+
+
+async def _build_from_seed(seed: dict) -> tuple[dict, dict, str, bytes]:
+    """Resolve, fetch, and render one seed. Returns (seed, metadata, title, png_bytes); raises on failure."""
+    source = seed.get("source", "fred")
+    if (source or "fred").strip().lower() == "fred" and seed.get("fredDiscovery"):
+        await asyncio.to_thread(_resolve_fred_discovery, seed)
+    metadata, log_id = _metadata_from_seed(seed)
+    logger.info(
+        "build_game source=%s id=%s startDate=%s endDate=%s",
+        source, log_id, seed["startDate"], seed["endDate"],
+    )
+    cached = _cached_image(metadata["id"])
+    if cached is not None:
+        png_bytes = cached[0]
+        metadata["title"] = await asyncio.to_thread(_series_title, metadata)
+    else:
+        # The title lookup and the data fetch are independent round-trips: run them side by side
+        # (threads, sharing the in-process caches); the render is CPU-bound (process)
+        metadata["title"], observations = await asyncio.gather(
+            asyncio.to_thread(_series_title, metadata),
+            asyncio.to_thread(fetch_observations, metadata),
+        )
+        png_bytes = await _render_chart(build_puzzle(metadata, observations))
+        _store_image(metadata["id"], png_bytes)
+    return seed, metadata, metadata["title"], png_bytes
 
+
+async def _race_builds(seeds: list[dict], last_error: Exception | None = None) -> tuple[dict, dict, str, bytes]:
+    """
+    Build seeds concurrently, at most _RACE_WIDTH at a time (the next starts when one fails), and
+    return the first that succeeds (as _build_from_seed), cancelling the rest. A failed candidate
+    costs no extra round of latency, while upstream and render work stays bounded. 503 if all fail.
+    """
+    queued = iter(seeds)
+    tasks: set[asyncio.Task] = set()
+
+    def start_next() -> None:
+        seed = next(queued, None)
+        if seed is not None:
+            tasks.add(asyncio.create_task(_build_from_seed(seed)))
+
+    for _ in range(_RACE_WIDTH):
+        start_next()
     try:
-        from puzzles_factory import build_puzzle
-        from visualization.plotter import plot_to_bytes
+        while tasks:
+            done, tasks = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+            built = None
+            failed = 0
+            # Retrieve every finished task's outcome, even after a winner, so none is left unobserved
+            for task in done:
+                error = task.exception()
+                if error is None:
+                    built = built or task.result()
+                    continue
+                last_error = error
+                failed += 1
+                logger.warning("build_game candidate failed: %s", last_error)
+            if built is not None:
+                return built
+            for _ in range(failed):
+                start_next()
+    finally:
+        # Cancelling stops the coroutine; a fetch thread or render job already running still finishes
+        for task in tasks:
+            task.cancel()
+    raise HTTPException(
+        status_code=503,
+        detail=f"Could not fetch or render chart after {len(seeds)} tries. Last error: {last_error!s}",
+    )
+
+
+def _take_prewarmed(user_pref: str | None, sid: str) -> tuple | None:
+    """
+    A prewarmed build for user_pref that passes session sid's checks, or None. Builds that do not
+    fit stay queued for other players.
+    """
+    builds = _prewarmed.get(user_pref)
+    if not builds:
+        return None
+    for i, built in enumerate(builds):
+        if _fits_session(built[0], sid):
+            del builds[i]
+            return built
+    return None
+
+
+async def _prewarm(user_pref: str | None, sid: str) -> None:
+    """
+    Build one puzzle (new to session sid) ahead of time and park it in _prewarmed (failures are
+    only logged).
+    """
+    try:
+        seed = (await _candidate_seeds(user_pref, 1, sid))[0]
+        built = await _build_from_seed(seed)
     except Exception as e:
-        raise HTTPException(status_code=503, detail=f"Setup error: {e!s}") from e
+        logger.info("Prewarming next puzzle failed: %s", e)
+        return
+    builds = _prewarmed.get(user_pref)
+    if builds is None:
+        builds = _prewarmed[user_pref] = deque(maxlen=_PREWARM_PER_PREF)
+    _prewarmed.move_to_end(user_pref)
+    builds.append(built)
+    while len(_prewarmed) > _PREWARM_MAX_PREFS:
+        _prewarmed.popitem(last=False)
 
-    user_pref = (body.preference if body else None) or ""
-    user_pref = (user_pref or "").strip() or None
-    last_error = None
 
-    for attempt in range(1, _MAX_SEED_RETRIES + 1):
-        seed = _pending_seed
-        if seed is None:
-            if attempt == 1:
-                raise HTTPException(
-                    status_code=409,
-                    detail="No pending seed. Call GET /api/game/seed first.",
-                )
-            try:
-                seed = _get_valid_seed(user_pref)
-                _pending_seed = seed
-            except HTTPException:
-                raise
-        source = seed.get("source", "fred")
-        start = seed["startDate"]
-        end = seed["endDate"]
-        if _intervals_overlap(start, end, _session_displayed_intervals) or _metric_key(seed) in _session_displayed_metrics:
-            _pending_seed = None
-            if attempt < _MAX_SEED_RETRIES:
-                try:
-                    seed = _get_valid_seed(user_pref)
-                    _pending_seed = seed
-                except HTTPException:
-                    raise
-                continue
-            raise HTTPException(status_code=503, detail="Seed no longer valid for session. Call GET /api/game/seed again.")
-        if (source or "fred").strip().lower() == "fred" and seed.get("fredDiscovery"):
-            try:
-                _resolve_fred_discovery(seed)
-            except ValueError as e:
-                last_error = e
-                _pending_seed = None
-                logger.warning("build_game attempt=%s FRED discovery resolve failed: %s", attempt, e)
-                if attempt < _MAX_SEED_RETRIES:
-                    try:
-                        seed = _get_valid_seed(user_pref)
-                        _pending_seed = seed
-                    except HTTPException:
-                        raise
-                continue
-        try:
-            metadata, title, log_id = _metadata_and_title_from_seed(seed)
-        except ValueError as e:
-            last_error = e
-            _pending_seed = None
-            logger.warning("build_game attempt=%s metadata from seed failed: %s", attempt, e)
-            continue
-        logger.info(
-            "build_game attempt=%s/%s source=%s id=%s startDate=%s endDate=%s",
-            attempt, _MAX_SEED_RETRIES, source, log_id, start, end,
+def _schedule_prewarm(user_pref: str | None, sid: str) -> None:
+    """
+    Start preparing the next puzzle for user_pref in the background, unless one is in progress or
+    a queued one already fits session sid.
+    """
+    task = _prewarm_tasks.get(user_pref)
+    if task is not None and not task.done():
+        return
+    builds = _prewarmed.get(user_pref)
+    if builds and any(_fits_session(built[0], sid) for built in builds):
+        return
+    task = _prewarm_tasks[user_pref] = asyncio.create_task(_prewarm(user_pref, sid))
+
+    def forget(done: asyncio.Task) -> None:
+        if _prewarm_tasks.get(user_pref) is done:
+            del _prewarm_tasks[user_pref]
+
+    task.add_done_callback(forget)
+
+
+def _register_game(
+    seed: dict,
+    metadata: dict,
+    title: str,
+    png_bytes: bytes,
+    *,
+    inline_image: bool,
+    user_pref: str | None,
+    sid: str,
+) -> dict:
+    """
+    Start a game for the built puzzle, record it in session sid, start prewarming the next puzzle,
+    and return the build response.
+    """
+    seed_source = seed.get("seed_source", "unknown")
+    hints = seed.get("hints")
+    # Seeds from generate_puzzle_seed already carry exactly 4 hints (_ensure_hints); pad only odd ones
+    if type(hints) is not list or len(hints) != 4:
+        hints = list(hints or [])[:4]
+        while len(hints) < 4:
+            hints.append(seed.get("correctEvent") or "The correct event.")
+    # Only what guessing needs: id, title and the chart go out in the response (the PNG stays in the
+    # image cache and is base64-encoded only for inlineImage requests)
+    game = {
+        "correctEvent": seed["correctEvent"],
+        "acceptableAnswers": list(seed.get("acceptableAnswers") or []),
+        "_acceptable_norm": _acceptable_set(seed),
+        "explanation": seed.get("explanation") or "",
+        "hints": hints,
+        "attempts_left": 4,
+        "preference": user_pref,
+        "session": sid,
+    }
+    _record_displayed(seed, sid)
+    out = {
+        "id": metadata["id"],
+        "title": title,
+        "gameToken": _store_game(game),
+        "imageUrl": f"/api/game/image/{quote(metadata['id'], safe='')}",
+        "seed_source": seed_source,
+        "attempts_left": 4,
+    }
+    if inline_image:
+        out["imageBase64"] = _b64encode(png_bytes).decode("ascii")
+        out["imageType"] = CHART_MEDIA_TYPE
+    _schedule_prewarm(user_pref, sid)
+    return out
+
+
+@app.post("/api/game/build")
+async def build_game(body: BuildBody | None = None, sid: str = Depends(_session_id)):
+    """
+    Build the puzzle from the seed GET /api/game/seed stored for this session (fetch data, render chart),
+    register the game.
+    Frontend can show "Fetching economic data..." during this call.
+    Call GET /api/game/seed first. Optional body.preference used for the replacement seeds if the stored one fails.
+    Returns { id, title, gameToken, imageUrl, seed_source, attempts_left } (+ imageBase64 and
+    imageType if body.inlineImage). Send gameToken back with each guess.
+    On failure returns 503.
+    """
+    pending = _pending.pop(sid)
+    if pending is None:
+        raise HTTPException(
+            status_code=409,
+            detail="No pending seed. Call GET /api/game/seed first.",
         )
+    seed, built = pending
+    user_pref = ((body.preference if body else None) or "").strip() or None
+    inline_image = body is not None and body.inlineImage
+
+    last_error = None
+    if built is None and _fits_session(seed, sid):
         try:
-            puzzle = build_puzzle(metadata)
-            png_bytes = plot_to_bytes(puzzle)
+            built = await _build_from_seed(seed)
         except Exception as e:
             last_error = e
-            _pending_seed = None
-            logger.warning("build_game attempt=%s/%s failed source=%s id=%s error=%s", attempt, _MAX_SEED_RETRIES, source, log_id, e)
-            if attempt < _MAX_SEED_RETRIES:
-                try:
-                    seed = _get_valid_seed(user_pref)
-                    _pending_seed = seed
-                except HTTPException:
-                    raise
-            continue
-        image_b64 = base64.standard_b64encode(png_bytes).decode("ascii")
-        seed_source = seed.get("seed_source", "unknown")
-        hints = list(seed.get("hints") or [])[:4]
-        while len(hints) < 4:
-            hints.append(seed.get("correctEvent") or "The correct event.")
-        _current_game = {
-            "id": metadata["id"],
-            "title": title,
-            "imageBase64": image_b64,
-            "correctEvent": seed["correctEvent"],
-            "acceptableAnswers": list(seed.get("acceptableAnswers") or []),
-            "explanation": seed.get("explanation") or "",
-            "seed_source": seed_source,
-            "hints": hints,
-            "attempts_left": 4,
-        }
-        _session_displayed_intervals.append((start, end))
-        _session_displayed_metrics.add(_metric_key(seed))
-        _pending_seed = None
-        return {
-            "id": _current_game["id"],
-            "title": _current_game["title"],
-            "imageBase64": _current_game["imageBase64"],
-            "seed_source": seed_source,
-            "attempts_left": 4,
-        }
-    raise HTTPException(
-        status_code=503,
-        detail=f"Could not fetch or render chart after {_MAX_SEED_RETRIES} tries. Last error: {last_error!s}",
-    )
+            logger.warning("build_game pending seed failed source=%s error=%s", seed.get("source", "fred"), e)
+    if built is None:
+        # The stored seed is stale or unusable: race the remaining attempts on a fresh batch of seeds
+        seeds = await _candidate_seeds(user_pref, _MAX_SEED_RETRIES - 1, sid)
+        built = await _race_builds(seeds, last_error)
+    return _register_game(*built, inline_image=inline_image, user_pref=user_pref, sid=sid)
 
 
 @app.get("/api/game/new")
-def new_game(preference: str | None = None):
+async def new_game(preference: str | None = None, inlineImage: bool = False, sid: str = Depends(_session_id)):
     """
-    One-shot: generate seed and build puzzle (same as GET /api/game/seed then POST /api/game/build).
-    Kept for backward compatibility. Prefer the two-step flow for stage-based loading messages.
+    One-shot: generate seeds and build the first puzzle that renders (no stage-based loading messages).
+    Kept for backward compatibility. Prefer GET /api/game/seed then POST /api/game/build.
     """
-    global _pending_seed
-    get_seed(preference)
-    return build_game(BuildBody(preference=preference))
+    user_pref = (preference or "").strip() or None
+    built = _take_prewarmed(user_pref, sid)
+    if built is None:
+        built = await _race_builds(await _candidate_seeds(user_pref, _MAX_SEED_RETRIES, sid))
+    return _register_game(*built, inline_image=inlineImage, user_pref=user_pref, sid=sid)
+
+
+@app.get("/api/game/image/{pid:path}")
+async def get_image(pid: str, request: Request):
+    """
+    Chart image (CHART_FORMAT) for a built puzzle (imageUrl from /api/game/build). 404 once it is no
+    longer cached; 304 when the client's If-None-Match already has this image.
+    """
+    cached = _cached_image(pid)
+    if cached is None:
+        raise HTTPException(status_code=404, detail="Unknown or expired puzzle image.")
+    png_bytes, etag = cached
+    headers = {"Cache-Control": "public, max-age=86400", "ETag": etag}
+    if_none_match = request.headers.get("if-none-match") or ""
+    if any(tag.strip().removeprefix("W/") in (etag, "*") for tag in if_none_match.split(",")):
+        return Response(status_code=304, headers=headers)
+    return Response(png_bytes, media_type=CHART_MEDIA_TYPE, headers=headers)
 
 
 class GuessBody(BaseModel):
     guess: str
+    # From /api/game/build; omitted by older clients, which then guess against their session's latest game
+    gameToken: str | None = None
 
 
 @app.post("/api/game/guess")
-def submit_guess(body: GuessBody):
+async def submit_guess(body: GuessBody, sid: str = Depends(_session_id)):
     """
-    Check guess against the current game. Player has 4 attempts; each wrong guess
+    Check guess against the game for body.gameToken. Player has 4 attempts; each wrong guess
     returns the next hint. Answer (correctEvent) only returned when attempts exhausted.
     """
-    if _current_game is None:
+    game = _get_game(body.gameToken, sid)
+    if game is None:
         raise HTTPException(
             status_code=409,
             detail="No active game. Call GET /api/game/new first.",
         )
+    # One guess per game at a time, so attempts_left is checked and decremented atomically
+    async with game["lock"]:
+        return await _evaluate_guess(game, body.guess)
+
 
-    attempts_left = max(0, _current_game.get("attempts_left", 0))
+async def _evaluate_guess(game: dict, guess: str) -> dict:
+    """Score guess against game and consume an attempt if wrong (caller holds game["lock"])."""
+    attempts_left = max(0, game.get("attempts_left", 0))
     if attempts_left <= 0:
         return {
             "correct": False,
             "attempts_left": 0,
             "hint": None,
-            "correctEvent": _current_game.get("correctEvent") or "",
-            "explanation": _current_game.get("explanation") or "",
+            "correctEvent": game.get("correctEvent") or "",
+            "explanation": game.get("explanation") or "",
         }
 
-    acceptable = list(_current_game.get("acceptableAnswers") or [])
-    correct_event = _current_game.get("correctEvent") or ""
-    if correct_event:
-        acceptable.append(correct_event)
-    correct = _check_guess(body.guess, acceptable)
+    correct_event = game.get("correctEvent") or ""
+    correct = _check_guess(guess, game["_acceptable_norm"])
 
     # If not in the list, ask LLM whether the guess is semantically correct
     if not correct:
         try:
-            from api.guess_evaluator import evaluate_guess_with_llm
-            correct = evaluate_guess_with_llm(
-                body.guess,
+            correct = await evaluate_guess_with_llm_async(
+                guess,
                 correct_event,
-                list(_current_game.get("acceptableAnswers") or []),
+                list(game.get("acceptableAnswers") or []),
             )
         except Exception:
             correct = False
 
     if correct:
+        # The player moves on next: make sure a puzzle is being prepared (another player may have taken
+        # the one prewarmed at build time, or that prewarm failed)
+        _schedule_prewarm(game["preference"], game["session"])
         return {
             "correct": True,
             "attempts_left": attempts_left,
-            "explanation": _current_game.get("explanation") or "",
+            "explanation": game.get("explanation") or "",
         }
 
     # Single decrement per request; never go below 0
-    _current_game["attempts_left"] = max(0, attempts_left - 1)
-    attempts_left = _current_game["attempts_left"]
-    hints = _current_game.get("hints") or []
+    game["attempts_left"] = max(0, attempts_left - 1)
+    attempts_left = game["attempts_left"]
+    hints = game.get("hints") or []
     hint_index = 4 - attempts_left - 1
     hint = hints[hint_index] if 0 <= hint_index < len(hints) else None
 
@@ -474,8 +856,12 @@ def submit_guess(body: GuessBody):
     }
     # Always include answer when no attempts left so the UI can show it
     if attempts_left <= 0:
-        out["correctEvent"] = _current_game.get("correctEvent") or ""
-        out["explanation"] = _current_game.get("explanation") or ""
+        # Game over: every hint has been served and no guess is checked again
+        for key in ("hints", "acceptableAnswers", "_acceptable_norm"):
+            game.pop(key, None)
+        _schedule_prewarm(game["preference"], game["session"])
+        out["correctEvent"] = game.get("correctEvent") or ""
+        out["explanation"] = game.get("explanation") or ""
     return out
 
 
@@ -485,3 +871,11 @@ if STATIC_DIR.is_dir():
     @app.get("/")
     def index():
         return FileResponse(STATIC_DIR / "index.html")
+
+
+if __name__ == "__main__":
+    import runpy
+
+    # Run the launcher as the __main__ module (not this file) so render processes spawned by the
+    # server do not re-import the whole app
+    runpy.run_module("ui", run_name="__main__", alter_sys=True)
@@ -0,0 +1,11 @@
+"""
+Code run inside the app's chart render processes. Imports only the plotter, so a worker
+process loads matplotlib and PIL but not the web app or its API clients.
+"""
+
+from visualization.plotter import plot_to_bytes
+
+
+def render_chart(puzzle: dict, fmt: str) -> bytes:
+    """Chart image bytes for a built puzzle (fmt: visualization.plotter.CHART_FORMATS key)."""
+    return plot_to_bytes(puzzle, fmt=fmt)
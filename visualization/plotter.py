@@ -4,27 +4,56 @@ Uses chartType, yLabel, yLimits, and series from the built puzzle (no source-spe
 """
 
 import io
+import threading
 from pathlib import Path
 from typing import Any
 
 import matplotlib
 matplotlib.use("Agg")  # headless backend for server (no display)
+# Cheaper line rendering on long series: merge segments that deviate < 1px, draw paths in chunks
+matplotlib.rcParams["path.simplify"] = True
+matplotlib.rcParams["path.simplify_threshold"] = 1.0
+matplotlib.rcParams["agg.path.chunksize"] = 10000
 import matplotlib.dates as mdates
-import matplotlib.pyplot as plt
 import numpy as np
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+from PIL import Image
+
+# zlib level for plot_to_bytes: 1 encodes ~2x faster than PIL's default 6 for ~35% larger PNGs
+PNG_COMPRESS_LEVEL = 1
+# plot_to_bytes resolution: the default 10x5in figure comes out 800x400 px, enough for the web UI
+WEB_DPI = 80
+# plot_to_bytes encoders by format: (PIL format, save options, media type). Charts are flat colours and
+# thin lines, so WebP stays lossless; method 1 / quality 0 is ~40% smaller than PNG for a few ms more.
+CHART_FORMATS = {
+    "png": ("PNG", {"compress_level": PNG_COMPRESS_LEVEL}, "image/png"),
+    "webp": ("WEBP", {"lossless": True, "method": 1, "quality": 0}, "image/webp"),
+}
+
+# Fixed margins (figure fractions) per figsize, so the common template skips tight_layout's ~30ms
+# bbox solve. Sized for the widest y tick labels FRED produces (e.g. "-800000") plus the
+# rotated date labels and a scientific-notation offset above the axes; other sizes use tight_layout.
+_FIXED_SUBPLOT_PARAMS = {
+    (10, 5): {"left": 0.11, "right": 0.975, "bottom": 0.19, "top": 0.89},
+}
+
+
+def _parse_dates(dates: list[str]) -> np.ndarray:
+    """Parse YYYY-MM-DD strings to datetime64[D] (NumPy parses ISO dates in C; matplotlib plots them directly)."""
+    return np.array(dates, dtype="datetime64[D]")
+
+
+def _get_values(values: list) -> np.ndarray:
+    """Extract values as float array."""
+    return np.asarray(values, dtype=float)
 
 
-def _parse_dates(series: list[dict]) -> np.ndarray:
-    """Parse date strings to matplotlib-friendly format."""
-    from datetime import datetime
-
-    dates = [datetime.strptime(ob["date"], "%Y-%m-%d") for ob in series]
-    return np.array(dates)
-
-
-def _get_values(series: list[dict]) -> np.ndarray:
-    """Extract values as float array."""
-    return np.array([float(ob["value"]) for ob in series], dtype=float)
+def _series_columns(series: dict | list[dict]) -> tuple[list, list]:
+    """(dates, values) from a {"dates", "values"} series; a legacy list of {date, value} is also accepted."""
+    if isinstance(series, dict):
+        return series.get("dates") or [], series.get("values") or []
+    return [ob["date"] for ob in series], [ob["value"] for ob in series]
 
 
 def _draw_line(ax: Any, dates: np.ndarray, values: np.ndarray) -> None:
@@ -39,30 +68,50 @@ def _draw_area(ax: Any, dates: np.ndarray, values: np.ndarray) -> None:
 
 
 def _draw_bar(ax: Any, dates: np.ndarray, values: np.ndarray) -> None:
-    """Draw a bar chart. Width in days, scaled by point spacing."""
-    delta = (dates.max() - dates.min()).days
+    """Draw a bar chart. Width in days, scaled by point spacing (series are date-ordered)."""
+    delta = abs(int((dates[-1] - dates[0]) / np.timedelta64(1, "D")))
     width_days = (delta / max(len(dates), 1)) * 0.8 if delta else 1.0
     ax.bar(dates, values, width=width_days)
 
 
-def plot(
+# plot_to_bytes redraws one Figure per thread instead of building and tearing down a new one each time
+_thread_figure = threading.local()
+_DEFAULT_SUBPLOT_PARAMS = {
+    k: matplotlib.rcParams[f"figure.subplot.{k}"] for k in ("left", "right", "bottom", "top", "wspace", "hspace")
+}
+
+
+def _reusable_axes(figsize: tuple[float, float], dpi: float) -> tuple[Figure, Any]:
+    """This thread's (Figure, Axes), cleared and resized. Agg canvas, not registered with pyplot."""
+    fig = getattr(_thread_figure, "fig", None)
+    if fig is None:
+        fig = _thread_figure.fig = Figure()
+        FigureCanvasAgg(fig)
+        fig.add_subplot()
+    fig.set_size_inches(figsize, forward=False)
+    fig.set_dpi(dpi)
+    # tight_layout starts from the current subplot params; begin from the defaults like a new figure
+    # (only matters for sizes without fixed margins)
+    fig.subplots_adjust(**_DEFAULT_SUBPLOT_PARAMS)
+    ax = fig.axes[0]
+    ax.clear()
+    return fig, ax
+
+
+def _render_figure(
     puzzle: dict,
-    path: str | Path | None = None,
     *,
-    figsize: tuple[float, float] = (10, 5),
-    title: str | None = None,
-) -> None:
+    figsize: tuple[float, float],
+    title: str | None,
+    dpi: float | None = None,
+    reuse: bool = False,
+) -> Any:
     """
-    Plot the puzzle's series using chartType, yLabel, and optional yLimits.
-
-    Args:
-        puzzle: Built puzzle dict with "series", "chartType", "yLabel", and optional "yLimits".
-        path: If set, save figure to this path; otherwise show interactively.
-        figsize: Figure size (width, height).
-        title: Chart title. If None, uses puzzle["title"] (no causal spoilers).
+    Build the laid-out matplotlib Figure for the puzzle. dpi=None: rcParams default. With reuse the
+    thread's persistent figure is redrawn (dpi required; never close it), else the caller closes it.
     """
-    series = puzzle.get("series")
-    if not series:
+    series_dates, series_values = _series_columns(puzzle.get("series") or [])
+    if not series_dates:
         raise ValueError("Puzzle has no 'series' to plot")
 
     chart_type = puzzle.get("chartType", "line")
@@ -70,13 +119,19 @@ def plot(
     y_limits = puzzle.get("yLimits")  # optional (ymin, ymax)
     x_label = "Date"
 
-    dates = _parse_dates(series)
-    values = _get_values(series)
+    dates = _parse_dates(series_dates)
+    values = _get_values(series_values)
+
+    if reuse:
+        fig, ax = _reusable_axes(figsize, dpi)
+    else:
+        import matplotlib.pyplot as plt  # only plot() needs pyplot's figure management (savefig/show)
 
-    fig, ax = plt.subplots(figsize=figsize)
+        fig, ax = plt.subplots(figsize=figsize, dpi=dpi)
+    # Locator and formatter are set after any ax.clear(), which resets them
     ax.xaxis.set_major_formatter(mdates.DateFormatter("%Y-%m"))
     ax.xaxis.set_major_locator(mdates.MonthLocator(interval=max(1, len(dates) // 12)))
-    plt.xticks(rotation=45)
+    ax.tick_params(axis="x", labelrotation=45)
 
     if chart_type == "line":
         _draw_line(ax, dates, values)
@@ -93,7 +148,33 @@ def plot(
         ax.set_ylim(*y_limits)
     ax.set_title(title if title is not None else puzzle.get("title", ""))
 
-    fig.tight_layout()
+    fixed = _FIXED_SUBPLOT_PARAMS.get(tuple(figsize))
+    if fixed is not None:
+        fig.subplots_adjust(**fixed)
+    else:
+        fig.tight_layout()
+    return fig
+
+
+def plot(
+    puzzle: dict,
+    path: str | Path | None = None,
+    *,
+    figsize: tuple[float, float] = (10, 5),
+    title: str | None = None,
+) -> None:
+    """
+    Plot the puzzle's series using chartType, yLabel, and optional yLimits.
+
+    Args:
+        puzzle: Built puzzle dict with "series" ({"dates", "values"}), "chartType", "yLabel", and optional "yLimits".
+        path: If set, save figure to this path; otherwise show interactively.
+        figsize: Figure size (width, height).
+        title: Chart title. If None, uses puzzle["title"] (no causal spoilers).
+    """
+    import matplotlib.pyplot as plt
+
+    fig = _render_figure(puzzle, figsize=figsize, title=title)
 
     if path is not None:
         if isinstance(path, io.BytesIO):
@@ -111,10 +192,19 @@ def plot_to_bytes(
     *,
     figsize: tuple[float, float] = (10, 5),
     title: str | None = None,
-    dpi: int = 150,
+    dpi: int = WEB_DPI,
+    fmt: str = "png",
 ) -> bytes:
-    """Render the puzzle chart to PNG bytes (e.g. for serving in a web UI)."""
+    """
+    Render the puzzle chart to image bytes (e.g. for serving in a web UI); fmt is a CHART_FORMATS key.
+    Draws straight to the Agg buffer and encodes it with PIL, skipping savefig's export pipeline.
+    """
+    pil_format, save_options, _ = CHART_FORMATS[fmt]
+    canvas = _render_figure(puzzle, figsize=figsize, title=title, dpi=dpi, reuse=True).canvas
+    canvas.draw()
+    width, height = canvas.get_width_height()
+    image = Image.frombuffer("RGBA", (width, height), canvas.buffer_rgba(), "raw", "RGBA", 0, 1)
     buf = io.BytesIO()
-    plot(puzzle, path=buf, figsize=figsize, title=title)
-    buf.seek(0)
-    return buf.read()
+    # The figure background is opaque, so the alpha channel only costs encode time and bytes
+    image.convert("RGB").save(buf, pil_format, **save_options)
+    return buf.getvalue()